@@ -153,13 +153,18 @@ async def clear_database(
 
 @router.get("/backup", summary="Create database backup")
 async def backup_database(
+    compress: bool = True,
     db_service: DatabaseService = Depends(get_database_service),
 ) -> dict[str, Any]:
     """
     Create a backup of the database.
 
     Currently only supported for SQLite databases.
-    Creates a timestamped copy of the database file in the backups directory.
+    Creates a timestamped copy of the database file in the backups directory,
+    gzip-compressed by default.
+
+    Args:
+        compress: If true (default), write a .db.gz file instead of a raw copy
 
     Returns:
         Backup information including:
@@ -177,7 +182,9 @@ async def backup_database(
         ```
     """
     try:
-        result = db_service.backup_database()
+        # Offloaded to a worker thread: the copy can take seconds on a
+        # large database and must not block the event loop
+        result = await db_service.backup_database_async(compress=compress)
         return result
     except NotImplementedError as e:
         raise HTTPException(
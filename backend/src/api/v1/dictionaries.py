@@ -6,6 +6,7 @@ from uuid import UUID
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
     Form,
@@ -36,6 +37,17 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _run_ai_annotation_job(version_id: str) -> None:
+    """Generate AI annotations after the response, with a fresh session."""
+    from src.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        DictionaryService(db).generate_ai_annotations(version_id)
+    finally:
+        db.close()
+
+
 @router.get(
     "/",
     response_model=PaginatedResponse[DictionaryListItem],
@@ -80,9 +92,9 @@ async def list_dictionaries(
                 latest_version_number=(
                     max(v.version_number for v in d.versions) if d.versions else 1
                 ),
-                field_count=(
-                    len(d.versions[-1].fields) if d.versions and d.versions[-1].fields else 0
-                ),
+                # Counted in SQL by the service; Field rows are not loaded
+                # for the list view
+                field_count=d.latest_field_count,
             )
             for d in dictionaries
         ]
@@ -113,6 +125,7 @@ async def list_dictionaries(
     description="Upload a JSON, XML, SQLite, or GeoPackage file and create a data dictionary from it.",
 )
 async def create_dictionary(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="JSON, XML, SQLite, or GeoPackage file to analyze"),
     name: str = Form(..., description="Dictionary name"),
     description: str | None = Form(None, description="Dictionary description"),
@@ -125,7 +138,11 @@ async def create_dictionary(
     """
     Create a new dictionary from uploaded JSON, XML, SQLite, or GeoPackage file.
 
+    AI descriptions are generated after the response via a background
+    task; the version's processing_stats tracks ai_annotation_status.
+
     Args:
+        background_tasks: FastAPI background task queue
         file: JSON, XML, SQLite, or GeoPackage file to analyze
         name: Dictionary name
         description: Optional description
@@ -175,6 +192,7 @@ async def create_dictionary(
                 created_by=current_user,
                 generate_ai_descriptions=generate_ai_descriptions,
                 original_filename=file.filename,
+                defer_ai_annotations=True,
             )
 
             logger.info(f"Created dictionary {dictionary.id} from file {file.filename}")
@@ -184,6 +202,13 @@ async def create_dictionary(
                 dictionary.versions[-1] if dictionary.versions else None
             )
 
+            # Annotate after the response: the LLM round-trips no longer
+            # gate dictionary creation
+            if generate_ai_descriptions and latest_version:
+                background_tasks.add_task(
+                    _run_ai_annotation_job, latest_version.id
+                )
+
             return DictionaryResponse(
                 id=dictionary.id,
                 name=dictionary.name,
@@ -1,4 +1,5 @@
 """Export endpoints for generating data dictionary exports."""
+import asyncio
 import logging
 from datetime import datetime
 from uuid import UUID
@@ -11,7 +12,7 @@ from fastapi import (
     Query,
     status,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 
 from src.api.dependencies import (
@@ -75,8 +76,10 @@ async def export_to_excel(
         HTTPException: If dictionary/version not found or export fails
     """
     try:
-        # Export to Excel using service
-        file_path = export_service.export_to_excel(
+        # Export to Excel in a worker thread; workbook generation is
+        # CPU-bound and would otherwise block the event loop
+        file_path = await asyncio.to_thread(
+            export_service.export_to_excel,
             dictionary_id=dictionary_id,
             version_id=version_id,
             include_statistics=include_statistics,
@@ -134,7 +137,7 @@ async def export_to_json(
     include_pii_info: bool = Query(True, description="Include PII detection info"),
     current_user: str = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service),
-) -> dict:
+) -> JSONResponse:
     """
     Export dictionary to JSON format.
 
@@ -151,7 +154,7 @@ async def export_to_json(
         export_service: Export service instance
 
     Returns:
-        dict: Complete dictionary data in JSON format
+        JSONResponse: Complete dictionary data in JSON format
 
     Raises:
         HTTPException: If dictionary/version not found or export fails
@@ -170,7 +173,9 @@ async def export_to_json(
             f"User {current_user} exported dictionary {dictionary_id} to JSON"
         )
 
-        return export_data
+        # The payload is already JSON-safe; returning a JSONResponse skips
+        # FastAPI's jsonable_encoder pass over every field dict
+        return JSONResponse(content=export_data)
 
     except NotFoundError as e:
         raise HTTPException(
@@ -220,8 +225,9 @@ async def export_version_comparison(
         HTTPException: If versions not found or comparison fails
     """
     try:
-        # Export comparison to Excel
-        file_path = export_service.export_version_comparison(
+        # Export comparison to Excel off the event loop
+        file_path = await asyncio.to_thread(
+            export_service.export_version_comparison,
             dictionary_id=dictionary_id,
             version_1_number=version_1,
             version_2_number=version_2,
@@ -300,8 +306,10 @@ async def batch_export_to_excel(
         if not request.dictionary_ids:
             raise AppValidationError("At least one dictionary ID is required")
 
-        # Export to Excel using service
-        file_path = export_service.batch_export_to_excel(
+        # Export to Excel in a worker thread; batch workbook generation
+        # is the most CPU-heavy export path
+        file_path = await asyncio.to_thread(
+            export_service.batch_export_to_excel,
             dictionary_ids=request.dictionary_ids,
             include_statistics=request.include_statistics,
             include_annotations=request.include_annotations,
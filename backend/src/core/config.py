@@ -103,6 +103,9 @@ class Settings(BaseSettings):
     EXCEL_MAX_ROWS: int = 1048576
     EXPORT_TEMP_DIR: str = "/tmp/data-dict-exports"
 
+    # Stats Caching
+    STATS_CACHE_TTL: int = 30  # Seconds to cache database stats responses (0 = disabled)
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = False
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
@@ -54,6 +55,10 @@ class ExcelExporter(BaseExporter):
     ALIGNMENT_CENTER = Alignment(horizontal="center", vertical="center")
     ALIGNMENT_LEFT = Alignment(horizontal="left", vertical="center", wrap_text=True)
 
+    # Field count above which exports stream through a write-only
+    # workbook instead of building the full workbook in memory
+    LARGE_EXPORT_THRESHOLD = 50_000
+
     # Column definitions
     COLUMNS = [
         {"header": "Field Path", "width": 40},
@@ -66,6 +71,12 @@ class ExcelExporter(BaseExporter):
         {"header": "PII Flag", "width": 12},
     ]
 
+    # Column letter -> width, precomputed once from COLUMNS
+    COLUMN_WIDTHS = {
+        get_column_letter(i): column_def["width"]
+        for i, column_def in enumerate(COLUMNS, start=1)
+    }
+
     def export_dictionary(
         self,
         dictionary: "Dictionary",
@@ -87,6 +98,11 @@ class ExcelExporter(BaseExporter):
         # Validate output path
         self.validate_output_path(output_path)
 
+        # Very large dictionaries stream row-by-row to keep memory flat
+        if len(fields) > self.LARGE_EXPORT_THRESHOLD:
+            self._export_dictionary_streaming(dictionary, fields, output_path)
+            return
+
         # Create workbook (not write-only to support formatting)
         wb = Workbook()
         wb.remove(wb.active)  # Remove default sheet
@@ -105,6 +121,197 @@ class ExcelExporter(BaseExporter):
         except Exception as e:
             raise OSError(f"Failed to save Excel file to {output_path}: {e}") from e
 
+    def _export_dictionary_streaming(
+        self,
+        dictionary: "Dictionary",
+        fields: list["Field"],
+        output_path: Path,
+    ) -> None:
+        """
+        Export a large dictionary via a write-only workbook.
+
+        Rows are flushed to disk as they are appended, so peak memory is
+        bounded by a single row instead of the whole workbook. Styling is
+        preserved per cell; the metadata sheet skips the cosmetic merged
+        title cell, which write-only mode does not support.
+
+        Args:
+            dictionary: The Dictionary object containing metadata
+            fields: List of Field objects to export
+            output_path: Path where the Excel file should be saved
+        """
+        wb = Workbook(write_only=True)
+
+        # Data sheet: layout must be configured before rows are appended
+        ws = wb.create_sheet("Data Dictionary")
+        for letter, width in self.COLUMN_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
+        ws.freeze_panes = "A2"
+        if fields:
+            last_column = get_column_letter(len(self.COLUMNS))
+            ws.auto_filter.ref = f"A1:{last_column}{len(fields) + 1}"
+
+        header_row = []
+        for column_def in self.COLUMNS:
+            cell = WriteOnlyCell(ws, value=column_def["header"])
+            cell.fill = self.HEADER_FILL
+            cell.font = self.HEADER_FONT
+            cell.alignment = self.ALIGNMENT_CENTER
+            cell.border = self.BORDER_STYLE
+            header_row.append(cell)
+        ws.append(header_row)
+
+        for row_idx, field in enumerate(fields, start=2):
+            ws.append(self._build_streaming_row(ws, row_idx, field))
+
+        # Metadata sheet
+        metadata_sheet = wb.create_sheet("Metadata")
+        self._write_metadata_sheet_streaming(
+            metadata_sheet, dictionary, len(fields)
+        )
+
+        try:
+            wb.save(output_path)
+        except Exception as e:
+            raise OSError(f"Failed to save Excel file to {output_path}: {e}") from e
+
+    def _build_streaming_row(self, ws, row_idx: int, field: "Field") -> list:
+        """
+        Build a styled row of WriteOnlyCells for one field.
+
+        Mirrors the formatting applied by _write_field_row.
+
+        Args:
+            ws: Write-only worksheet the cells belong to
+            row_idx: Row index (1-based) for alternating fills
+            field: Field object to write
+
+        Returns:
+            List of WriteOnlyCell objects ready for ws.append
+        """
+        row_fill = self.ROW_EVEN_FILL if row_idx % 2 == 0 else self.ROW_ODD_FILL
+
+        # Read each ORM attribute once; instrumented attribute access is
+        # not free in the per-cell loop below
+        is_pii = field.is_pii
+        null_percentage = field.null_percentage
+
+        annotation = field.annotations[0] if field.annotations else None
+        description = annotation.description if annotation else ""
+        sample_values = self._format_sample_values(field.sample_values)
+        null_pct = f"{null_percentage:.1f}%" if null_percentage is not None else ""
+        pii_flag = "Yes" if is_pii else "No"
+
+        row_data = [
+            field.field_path,
+            field.data_type,
+            field.semantic_type or "",
+            description,
+            sample_values,
+            null_pct,
+            field.distinct_count,
+            pii_flag,
+        ]
+
+        row = []
+        for col_idx, value in enumerate(row_data, start=1):
+            cell = WriteOnlyCell(ws, value=value)
+
+            if is_pii:
+                cell.fill = self.PII_FILL
+                if col_idx == 8:  # PII Flag column
+                    cell.font = self.PII_FONT
+            else:
+                cell.fill = row_fill
+
+            if col_idx == 6 and null_percentage is not None:
+                if null_percentage > 50:
+                    cell.fill = self.NULL_HIGH_FILL
+                elif null_percentage > 20:
+                    cell.fill = self.NULL_MEDIUM_FILL
+
+            if col_idx in [2, 6, 7, 8]:  # Data Type, Null %, Cardinality, PII Flag
+                cell.alignment = self.ALIGNMENT_CENTER
+            else:
+                cell.alignment = self.ALIGNMENT_LEFT
+
+            cell.border = self.BORDER_STYLE
+            row.append(cell)
+
+        return row
+
+    def _write_metadata_sheet_streaming(
+        self, ws, dictionary: "Dictionary", num_fields: int
+    ) -> None:
+        """
+        Write the metadata sheet on a write-only worksheet.
+
+        Args:
+            ws: Write-only worksheet to write to
+            dictionary: Dictionary object with metadata
+            num_fields: Number of fields in the dictionary
+        """
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 50
+
+        key_fill = PatternFill(
+            start_color="E7E6E6", end_color="E7E6E6", fill_type="solid"
+        )
+        bold_font = Font(bold=True)
+        italic_font = Font(italic=True, size=9)
+
+        title = WriteOnlyCell(ws, value="Data Dictionary Metadata")
+        title.font = Font(size=14, bold=True, color="366092")
+        ws.append([title])
+        ws.append([])
+
+        metadata = [
+            ("Dictionary Name", dictionary.name),
+            ("Description", dictionary.description or "N/A"),
+            ("Source File", dictionary.source_file_name or "N/A"),
+            ("File Size (bytes)", dictionary.source_file_size or "N/A"),
+            ("Total Records Analyzed", dictionary.total_records_analyzed or "N/A"),
+            ("Total Fields", num_fields),
+            ("Created At", self._format_datetime(dictionary.created_at)),
+            ("Created By", dictionary.created_by or "N/A"),
+            ("Updated At", self._format_datetime(dictionary.updated_at)),
+            ("Dictionary ID", str(dictionary.id)),
+        ]
+
+        for key, value in metadata:
+            key_cell = WriteOnlyCell(ws, value=key)
+            key_cell.font = bold_font
+            key_cell.fill = key_fill
+            key_cell.border = self.BORDER_STYLE
+            key_cell.alignment = self.ALIGNMENT_LEFT
+
+            value_cell = WriteOnlyCell(ws, value=value)
+            value_cell.border = self.BORDER_STYLE
+            value_cell.alignment = self.ALIGNMENT_LEFT
+
+            ws.append([key_cell, value_cell])
+
+        # Additional custom metadata if present
+        if dictionary.custom_metadata:
+            ws.append([])
+            section = WriteOnlyCell(ws, value="Additional Metadata")
+            section.font = Font(bold=True, size=12)
+            ws.append([section])
+
+            for key, value in dictionary.custom_metadata.items():
+                key_cell = WriteOnlyCell(ws, value=str(key))
+                key_cell.font = bold_font
+                key_cell.fill = key_fill
+                ws.append([key_cell, str(value)])
+
+        # Export timestamp
+        ws.append([])
+        ts_key = WriteOnlyCell(ws, value="Exported At")
+        ts_key.font = italic_font
+        ts_value = WriteOnlyCell(ws, value=self._format_datetime(datetime.now(UTC)))
+        ts_value.font = italic_font
+        ws.append([ts_key, ts_value])
+
     def _write_data_sheet(self, ws: Worksheet, fields: list["Field"]) -> None:
         """
         Write the main data dictionary sheet with formatting.
@@ -147,6 +354,11 @@ class ExcelExporter(BaseExporter):
         # Determine row fill based on even/odd and PII status
         row_fill = self.ROW_EVEN_FILL if row_idx % 2 == 0 else self.ROW_ODD_FILL
 
+        # Read each ORM attribute once; instrumented attribute access is
+        # not free in the per-cell loop below
+        is_pii = field.is_pii
+        null_percentage = field.null_percentage
+
         # Get annotation if available
         annotation = field.annotations[0] if field.annotations else None
         description = annotation.description if annotation else ""
@@ -155,10 +367,10 @@ class ExcelExporter(BaseExporter):
         sample_values = self._format_sample_values(field.sample_values)
 
         # Format null percentage
-        null_pct = f"{field.null_percentage:.1f}%" if field.null_percentage is not None else ""
+        null_pct = f"{null_percentage:.1f}%" if null_percentage is not None else ""
 
         # PII flag
-        pii_flag = "Yes" if field.is_pii else "No"
+        pii_flag = "Yes" if is_pii else "No"
 
         # Data for the row
         row_data = [
@@ -177,7 +389,7 @@ class ExcelExporter(BaseExporter):
             cell = ws.cell(row=row_idx, column=col_idx, value=value)
 
             # Apply PII highlighting if this is a PII field
-            if field.is_pii:
+            if is_pii:
                 cell.fill = self.PII_FILL
                 if col_idx == 8:  # PII Flag column
                     cell.font = self.PII_FONT
@@ -185,10 +397,10 @@ class ExcelExporter(BaseExporter):
                 cell.fill = row_fill
 
             # Apply null percentage formatting
-            if col_idx == 6 and field.null_percentage is not None:
-                if field.null_percentage > 50:
+            if col_idx == 6 and null_percentage is not None:
+                if null_percentage > 50:
                     cell.fill = self.NULL_HIGH_FILL
-                elif field.null_percentage > 20:
+                elif null_percentage > 20:
                     cell.fill = self.NULL_MEDIUM_FILL
 
             # Apply alignment
@@ -238,9 +450,8 @@ class ExcelExporter(BaseExporter):
 
     def _apply_column_widths(self, ws: Worksheet) -> None:
         """Apply auto-sized column widths based on column definitions."""
-        for col_idx, column_def in enumerate(self.COLUMNS, start=1):
-            column_letter = get_column_letter(col_idx)
-            ws.column_dimensions[column_letter].width = column_def["width"]
+        for letter, width in self.COLUMN_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
 
     def _apply_frozen_panes(self, ws: Worksheet) -> None:
         """Freeze the header row."""
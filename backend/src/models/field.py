@@ -65,7 +65,11 @@ class Field(Base):
     # Relationships
     version: Mapped["Version"] = relationship("Version", back_populates="fields")
     annotations: Mapped[list["Annotation"]] = relationship(
-        "Annotation", back_populates="field", cascade="all, delete-orphan"
+        "Annotation",
+        back_populates="field",
+        cascade="all, delete-orphan",
+        # Newest first, so annotations[0] is always the latest
+        order_by="desc(Annotation.created_at)",
     )
 
     def __repr__(self) -> str:
@@ -61,6 +61,12 @@ class GeoPackageParser(SQLiteParser):
         Raises:
             ValueError: If file is not a valid SQLite/GeoPackage database
         """
+        # Reset per-file metadata so a reused parser instance cannot carry
+        # state over from a previous GeoPackage
+        self.geometry_columns = {}
+        self.spatial_ref_systems = {}
+        self.contents_metadata = {}
+
         # Open database in read-only mode
         uri = f"file:{file_path}?mode=ro"
         try:
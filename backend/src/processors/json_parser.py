@@ -8,7 +8,7 @@ sample values.
 
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import ijson
 
@@ -29,6 +29,8 @@ class JSONParser:
         """
         self.max_samples = max_samples
         self.max_depth = max_depth
+        # Populated by iter_fields after each parse
+        self.last_parse_stats: dict[str, Any] = {}
 
     def parse_file(self, file_path: Path) -> dict[str, Any]:
         """
@@ -44,15 +46,35 @@ class JSONParser:
                 'is_array': bool  # Root is array or object
             }
         """
-        # Check if root is array or object
-        with open(file_path, 'rb') as f:
-            first_char = self._skip_whitespace(f)
-            is_array = first_char == b'['
+        fields_map, total_records, is_array = self._build_fields_map(file_path)
 
-        if is_array:
-            return self._parse_array_root(file_path)
-        else:
-            return self._parse_object_root(file_path)
+        return {
+            'fields': [field.to_dict() for field in fields_map.values()],
+            'total_records': total_records,
+            'is_array': is_array
+        }
+
+    def iter_fields(self, file_path: Path) -> Iterator[dict[str, Any]]:
+        """
+        Parse JSON file and stream field metadata one dict at a time.
+
+        Parsing happens eagerly (parse errors are raised here), but field
+        metadata dicts are produced lazily so callers never hold the full
+        field list in memory. After the call, `last_parse_stats` holds
+        'total_records' and 'is_array' for the parsed file.
+
+        Args:
+            file_path: Path to JSON file
+
+        Returns:
+            Iterator of field metadata dicts
+        """
+        fields_map, total_records, is_array = self._build_fields_map(file_path)
+        self.last_parse_stats = {
+            'total_records': total_records,
+            'is_array': is_array,
+        }
+        return (field.to_dict() for field in fields_map.values())
 
     def _skip_whitespace(self, f) -> bytes:
         """Skip whitespace and return first non-whitespace character."""
@@ -63,53 +85,48 @@ class JSONParser:
             if char not in b' \t\n\r':
                 return char
 
-    def _parse_array_root(self, file_path: Path) -> dict[str, Any]:
-        """Parse JSON array of objects"""
-        fields_map = {}  # field_path -> FieldMetadata
-        records_processed = 0
+    def _build_fields_map(
+        self, file_path: Path
+    ) -> tuple[dict[str, 'FieldMetadata'], int, bool]:
+        """
+        Stream the file once and accumulate per-field metadata.
 
+        Returns:
+            Tuple of (fields_map, total_records, is_array)
+        """
+        # Check if root is array or object
         with open(file_path, 'rb') as f:
-            # Use ijson for streaming parsing
-            items = ijson.items(f, 'item')
-
-            for item in items:
-                if records_processed >= self.max_samples:
-                    break
-
-                # Extract fields from this record
-                self._extract_fields(
-                    item,
-                    parent_path='',
-                    fields_map=fields_map,
-                    depth=0
-                )
-                records_processed += 1
-
-        return {
-            'fields': [field.to_dict() for field in fields_map.values()],
-            'total_records': records_processed,
-            'is_array': True
-        }
+            first_char = self._skip_whitespace(f)
+            is_array = first_char == b'['
 
-    def _parse_object_root(self, file_path: Path) -> dict[str, Any]:
-        """Parse single JSON object"""
-        fields_map = {}
+        fields_map: dict[str, FieldMetadata] = {}
+        records_processed = 0
 
         with open(file_path, 'rb') as f:
-            obj = ijson.items(f, '')
-            for item in obj:
-                self._extract_fields(
-                    item,
-                    parent_path='',
-                    fields_map=fields_map,
-                    depth=0
-                )
+            if is_array:
+                # Use ijson for streaming parsing of array items
+                for item in ijson.items(f, 'item'):
+                    if records_processed >= self.max_samples:
+                        break
+
+                    self._extract_fields(
+                        item,
+                        parent_path='',
+                        fields_map=fields_map,
+                        depth=0
+                    )
+                    records_processed += 1
+            else:
+                for item in ijson.items(f, ''):
+                    self._extract_fields(
+                        item,
+                        parent_path='',
+                        fields_map=fields_map,
+                        depth=0
+                    )
+                records_processed = 1
 
-        return {
-            'fields': [field.to_dict() for field in fields_map.values()],
-            'total_records': 1,
-            'is_array': False
-        }
+        return fields_map, records_processed, is_array
 
     def _extract_fields(
         self,
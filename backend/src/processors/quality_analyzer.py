@@ -8,6 +8,7 @@ for numeric fields.
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -28,6 +29,11 @@ class QualityAnalyzer:
         if not values:
             return {}
 
+        # Numeric fields take a vectorized NumPy path; everything else
+        # goes through pandas
+        if data_type in ('integer', 'float'):
+            return self._analyze_numeric_field(values)
+
         # Convert to pandas Series for analysis
         series = pd.Series(values)
 
@@ -39,20 +45,55 @@ class QualityAnalyzer:
             'cardinality_ratio': float(series.nunique() / len(values))
         }
 
-        # Numeric-specific metrics
-        if data_type in ('integer', 'float'):
-            numeric_values = pd.to_numeric(series, errors='coerce').dropna()
-            if len(numeric_values) > 0:
-                metrics.update({
-                    'min_value': float(numeric_values.min()),
-                    'max_value': float(numeric_values.max()),
-                    'mean_value': float(numeric_values.mean()),
-                    'median_value': float(numeric_values.median()),
-                    'std_dev': float(numeric_values.std()),
-                    'percentile_25': float(numeric_values.quantile(0.25)),
-                    'percentile_50': float(numeric_values.quantile(0.50)),
-                    'percentile_75': float(numeric_values.quantile(0.75))
-                })
+        return metrics
+
+    def _analyze_numeric_field(self, values: list[Any]) -> dict[str, Any]:
+        """
+        Analyze a numeric field with a single vectorized NumPy pass.
+
+        Samples are converted to a float64 array once, and null/distinct
+        counts plus order statistics are computed without per-value
+        pandas dispatch.
+
+        Args:
+            values: List of field values
+
+        Returns:
+            Dictionary of quality metrics
+        """
+        total_count = len(values)
+        non_null = [v for v in values if v is not None]
+        null_count = total_count - len(non_null)
+        distinct_count = len(set(non_null))
+
+        metrics = {
+            'total_count': total_count,
+            'null_count': null_count,
+            'null_percentage': float(null_count / total_count * 100),
+            'distinct_count': distinct_count,
+            'cardinality_ratio': float(distinct_count / total_count)
+        }
+
+        numeric = []
+        for v in non_null:
+            try:
+                numeric.append(float(v))
+            except (TypeError, ValueError):
+                continue
+
+        if numeric:
+            arr = np.asarray(numeric, dtype=np.float64)
+            p25, p50, p75 = np.percentile(arr, [25, 50, 75])
+            metrics.update({
+                'min_value': float(arr.min()),
+                'max_value': float(arr.max()),
+                'mean_value': float(arr.mean()),
+                'median_value': float(p50),
+                'std_dev': float(arr.std(ddof=1)) if arr.size > 1 else float('nan'),
+                'percentile_25': float(p25),
+                'percentile_50': float(p50),
+                'percentile_75': float(p75)
+            })
 
         return metrics
 
@@ -6,14 +6,18 @@ regenerating AI descriptions, and recalculating quality metrics.
 """
 
 import asyncio
+import hashlib
 import logging
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 
+from src.core.config import settings
 from src.core.exceptions import (
     DatabaseError,
     NotFoundError,
@@ -34,6 +38,31 @@ from src.processors.type_inferrer import TypeInferrer
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Files at or above this size are analyzed via the streaming parser path
+# to keep memory bounded
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Extra quality-metric keys copied when assembling results, keyed by data
+# type; avoids re-testing data_type membership per field in hot loops
+NUMERIC_KEYS = (
+    "min_value",
+    "max_value",
+    "mean_value",
+    "median_value",
+    "std_dev",
+    "percentile_25",
+    "percentile_50",
+    "percentile_75",
+)
+_EXTRA_KEYS_BY_TYPE = {"integer": NUMERIC_KEYS, "float": NUMERIC_KEYS}
+
+# In-process memo of semantic/PII detection results, keyed by a content
+# hash of the detector inputs. Bump DETECTOR_CACHE_VERSION whenever
+# detector logic changes so stale results are not reused.
+DETECTOR_CACHE_VERSION = "1"
+_DETECTION_CACHE: dict[bytes, tuple[str | None, bool, str | None]] = {}
+_DETECTION_CACHE_MAX = 10_000
+
 
 class AnalysisService:
     """
@@ -104,9 +133,20 @@ class AnalysisService:
         if not file_path.suffix.lower() == ".json":
             raise ValidationError("File must be a JSON file")
 
-        # Parse JSON
+        # Parse JSON - stream field metadata for large files to bound memory
+        file_size = file_path.stat().st_size
+
         try:
-            parse_result = self.json_parser.parse_file(file_path)
+            if file_size < STREAMING_THRESHOLD_BYTES:
+                parse_result = self.json_parser.parse_file(file_path)
+                field_iter = parse_result["fields"]
+                total_records = parse_result["total_records"]
+                is_array_root = parse_result["is_array"]
+            else:
+                field_iter = self.json_parser.iter_fields(file_path)
+                parse_stats = self.json_parser.last_parse_stats
+                total_records = parse_stats["total_records"]
+                is_array_root = parse_stats["is_array"]
         except Exception as e:
             logger.error(f"JSON parsing failed: {e}")
             raise ProcessingError(
@@ -116,58 +156,62 @@ class AnalysisService:
 
         # Analyze fields
         analyzed_fields = []
-        type_distribution = {}
-        semantic_type_distribution = {}
+        type_distribution = Counter()
+        semantic_type_distribution = Counter()
         pii_count = 0
+        fields_with_nulls = 0
+        max_nesting_level = 0
         total_null_percentage = 0.0
 
-        for field_meta in parse_result["fields"]:
+        for field_meta in field_iter:
+            # Bind hot metadata values to locals once per field
+            field_name = field_meta["field_name"]
+            sample_values = field_meta["sample_values"]
+            nesting_level = field_meta["nesting_level"]
+            null_pct = field_meta.get("null_percentage", 0.0)
+
             # Infer type
             data_type, confidence = self.type_inferrer.infer_type(
                 field_meta["types_seen"]
             )
 
-            # Detect semantic type
-            semantic_type = self.semantic_detector.detect(
-                field_meta["field_name"],
-                field_meta["sample_values"],
-                data_type,
-            )
-
-            # Detect PII
-            is_pii, pii_type = self.pii_detector.detect_pii(
+            # Detect semantic type and PII (memoized on content hash)
+            semantic_type, is_pii, pii_type = self._detect_semantic_and_pii(
                 field_meta["field_path"],
-                field_meta["field_name"],
-                semantic_type,
-                field_meta["sample_values"],
+                field_name,
+                data_type,
+                sample_values,
             )
 
             # Calculate quality metrics
             quality_metrics = self.quality_analyzer.analyze_field(
-                field_meta["sample_values"],
+                sample_values,
                 data_type,
             )
 
-            # Track statistics
-            type_distribution[data_type] = type_distribution.get(data_type, 0) + 1
+            # Track statistics (Counter defaults missing keys to 0)
+            type_distribution[data_type] += 1
 
             if semantic_type:
-                semantic_type_distribution[semantic_type] = (
-                    semantic_type_distribution.get(semantic_type, 0) + 1
-                )
+                semantic_type_distribution[semantic_type] += 1
 
             if is_pii:
                 pii_count += 1
 
-            null_pct = field_meta.get("null_percentage", 0)
             total_null_percentage += null_pct
 
+            if null_pct > 0:
+                fields_with_nulls += 1
+
+            if nesting_level > max_nesting_level:
+                max_nesting_level = nesting_level
+
             # Build field analysis
             field_analysis = {
                 "field_path": field_meta["field_path"],
-                "field_name": field_meta["field_name"],
+                "field_name": field_name,
                 "parent_path": field_meta["parent_path"],
-                "nesting_level": field_meta["nesting_level"],
+                "nesting_level": nesting_level,
                 "data_type": data_type,
                 "type_confidence": confidence,
                 "semantic_type": semantic_type,
@@ -175,50 +219,40 @@ class AnalysisService:
                 "pii_type": pii_type,
                 "is_array": field_meta.get("is_array", False),
                 "null_percentage": null_pct,
-                "sample_values": field_meta["sample_values"][:5],  # First 5 samples
+                "sample_values": sample_values[:5],  # First 5 samples
                 "distinct_count": quality_metrics.get("distinct_count", 0),
                 "cardinality_ratio": quality_metrics.get("cardinality_ratio", 0),
+                # Numeric statistics, when available for this data type
+                **{
+                    k: quality_metrics.get(k)
+                    for k in _EXTRA_KEYS_BY_TYPE.get(data_type, ())
+                },
             }
 
-            # Add numeric statistics if available
-            if data_type in ("integer", "float"):
-                field_analysis.update(
-                    {
-                        "min_value": quality_metrics.get("min_value"),
-                        "max_value": quality_metrics.get("max_value"),
-                        "mean_value": quality_metrics.get("mean_value"),
-                        "median_value": quality_metrics.get("median_value"),
-                    }
-                )
-
             analyzed_fields.append(field_analysis)
 
         # Calculate averages
-        num_fields = len(parse_result["fields"])
+        num_fields = len(analyzed_fields)
         avg_null_percentage = total_null_percentage / num_fields if num_fields > 0 else 0
 
         # Build summary
         result = {
             "file_info": {
                 "file_name": file_path.name,
-                "file_size": file_path.stat().st_size,
+                "file_size": file_size,
                 "file_path": str(file_path),
             },
             "schema_summary": {
                 "total_fields": num_fields,
-                "total_records": parse_result["total_records"],
-                "is_array_root": parse_result["is_array"],
-                "max_nesting_level": max(
-                    (f["nesting_level"] for f in parse_result["fields"]), default=0
-                ),
-                "type_distribution": type_distribution,
-                "semantic_type_distribution": semantic_type_distribution,
+                "total_records": total_records,
+                "is_array_root": is_array_root,
+                "max_nesting_level": max_nesting_level,
+                "type_distribution": dict(type_distribution),
+                "semantic_type_distribution": dict(semantic_type_distribution),
             },
             "quality_summary": {
                 "average_null_percentage": round(avg_null_percentage, 2),
-                "fields_with_nulls": sum(
-                    1 for f in parse_result["fields"] if f.get("null_percentage", 0) > 0
-                ),
+                "fields_with_nulls": fields_with_nulls,
             },
             "pii_summary": {
                 "total_pii_fields": pii_count,
@@ -251,6 +285,66 @@ class AnalysisService:
 
         return result
 
+    def _detect_semantic_and_pii(
+        self,
+        field_path: str,
+        field_name: str,
+        data_type: str,
+        sample_values: list[Any],
+    ) -> tuple[str | None, bool, str | None]:
+        """
+        Run semantic-type and PII detection with an in-process memo.
+
+        Detection is deterministic for a given field path/name, data type
+        and sample set, so results are cached keyed by a content hash of
+        those inputs. Re-analyzing a file whose fields have not changed
+        skips the detectors entirely.
+
+        Args:
+            field_path: Full dot-notation path to field
+            field_name: Name of the field
+            data_type: Inferred data type
+            sample_values: Sample values for the field
+
+        Returns:
+            Tuple of (semantic_type, is_pii, pii_type)
+        """
+        key = hashlib.blake2b(
+            "\x1f".join(
+                (
+                    DETECTOR_CACHE_VERSION,
+                    field_path,
+                    field_name,
+                    data_type,
+                    *(str(v) for v in sample_values[:5]),
+                )
+            ).encode(),
+            digest_size=16,
+        ).digest()
+
+        cached = _DETECTION_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        semantic_type = self.semantic_detector.detect(
+            field_name,
+            sample_values,
+            data_type,
+        )
+        is_pii, pii_type = self.pii_detector.detect_pii(
+            field_path,
+            field_name,
+            semantic_type,
+            sample_values,
+        )
+
+        if len(_DETECTION_CACHE) >= _DETECTION_CACHE_MAX:
+            _DETECTION_CACHE.clear()
+
+        result = (semantic_type, is_pii, pii_type)
+        _DETECTION_CACHE[key] = result
+        return result
+
     def regenerate_ai_descriptions(
         self,
         dictionary_id: UUID,
@@ -274,11 +368,17 @@ class AnalysisService:
             NotFoundError: If dictionary or version not found
             ProcessingError: If regeneration fails
         """
+        # Coerce UUIDs to strings once; they are reused in queries,
+        # logging and the response
+        dict_str = str(dictionary_id)
+        ver_req_str = str(version_id) if version_id else None
+
         logger.info(
-            f"Regenerating AI descriptions for dictionary {dictionary_id}",
+            "Regenerating AI descriptions for dictionary %s",
+            dict_str,
             extra={
-                "dictionary_id": str(dictionary_id),
-                "version_id": str(version_id) if version_id else "latest",
+                "dictionary_id": dict_str,
+                "version_id": ver_req_str or "latest",
                 "force": force,
             },
         )
@@ -287,13 +387,13 @@ class AnalysisService:
         if version_id:
             version = (
                 self.db.query(Version)
-                .filter(Version.id == str(version_id), Version.dictionary_id == str(dictionary_id))
+                .filter(Version.id == ver_req_str, Version.dictionary_id == dict_str)
                 .first()
             )
         else:
             version = (
                 self.db.query(Version)
-                .filter(Version.dictionary_id == str(dictionary_id))
+                .filter(Version.dictionary_id == dict_str)
                 .order_by(Version.version_number.desc())
                 .first()
             )
@@ -302,23 +402,27 @@ class AnalysisService:
             raise NotFoundError(
                 "Version not found",
                 details={
-                    "dictionary_id": str(dictionary_id),
-                    "version_id": str(version_id) if version_id else None,
+                    "dictionary_id": dict_str,
+                    "version_id": ver_req_str,
                 },
             )
 
-        # Get fields
+        ver_str = str(version.id)
+
+        # Get fields with annotations prefetched in one extra query
+        # instead of one query per field
         fields = (
             self.db.query(Field)
             .filter(Field.version_id == version.id)
+            .options(selectinload(Field.annotations))
             .order_by(Field.position)
             .all()
         )
 
         if not fields:
-            logger.warning(f"No fields found for version {version.id}")
+            logger.warning("No fields found for version %s", ver_str)
             return {
-                "version_id": str(version.id),
+                "version_id": ver_str,
                 "total_fields": 0,
                 "regenerated": 0,
                 "skipped": 0,
@@ -334,13 +438,9 @@ class AnalysisService:
         field_annotation_map = {}
 
         for field in fields:
-            # Check if annotation exists
-            existing_annotation = (
-                self.db.query(Annotation)
-                .filter(Annotation.field_id == field.id)
-                .order_by(Annotation.created_at.desc())
-                .first()
-            )
+            # Check if annotation exists (relationship is ordered newest
+            # first, so [0] is the latest)
+            existing_annotation = field.annotations[0] if field.annotations else None
 
             # Skip if annotation exists and not forcing
             if existing_annotation and not force:
@@ -353,7 +453,7 @@ class AnalysisService:
 
         # Generate AI descriptions in batch
         if fields_to_process:
-            logger.info(f"Generating AI descriptions for {len(fields_to_process)} fields")
+            logger.info("Generating AI descriptions for %d fields", len(fields_to_process))
 
             try:
                 # Run async batch processing
@@ -367,16 +467,17 @@ class AnalysisService:
                 failed = results["failed"]
 
             except Exception as e:
-                logger.error(f"Failed to generate AI descriptions in batch: {e}")
+                logger.error("Failed to generate AI descriptions in batch: %s", e)
                 failed = len(fields_to_process)
 
         # Commit changes
         try:
             self.db.commit()
             logger.info(
-                f"AI descriptions regenerated: {regenerated} fields",
+                "AI descriptions regenerated: %d fields",
+                regenerated,
                 extra={
-                    "version_id": str(version.id),
+                    "version_id": ver_str,
                     "regenerated": regenerated,
                     "skipped": skipped,
                     "failed": failed,
@@ -384,7 +485,7 @@ class AnalysisService:
             )
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to save AI descriptions: {e}")
+            logger.error("Failed to save AI descriptions: %s", e)
             raise DatabaseError(f"Failed to save AI descriptions: {str(e)}")
 
         # Audit log
@@ -392,8 +493,8 @@ class AnalysisService:
             "AI descriptions regenerated",
             extra={
                 "action": "regenerate_ai_descriptions",
-                "dictionary_id": str(dictionary_id),
-                "version_id": str(version.id),
+                "dictionary_id": dict_str,
+                "version_id": ver_str,
                 "regenerated_by": regenerated_by,
                 "regenerated": regenerated,
                 "skipped": skipped,
@@ -402,7 +503,7 @@ class AnalysisService:
         )
 
         return {
-            "version_id": str(version.id),
+            "version_id": ver_str,
             "version_number": version.version_number,
             "total_fields": len(fields),
             "regenerated": regenerated,
@@ -448,6 +549,11 @@ class AnalysisService:
             # Generate descriptions in batch (concurrent)
             results = await self.ai_generator.generate_batch(batch_input)
 
+            # Hoist loop invariants; all annotations from one regenerate
+            # call share the same model version and timestamp
+            model = self.ai_generator.model
+            now = datetime.now(timezone.utc)
+
             # Process results
             for field, (description, business_name) in zip(fields, results):
                 try:
@@ -458,8 +564,8 @@ class AnalysisService:
                         existing_annotation.description = description
                         existing_annotation.business_name = business_name
                         existing_annotation.is_ai_generated = True
-                        existing_annotation.ai_model_version = self.ai_generator.model
-                        existing_annotation.updated_at = datetime.now(timezone.utc)
+                        existing_annotation.ai_model_version = model
+                        existing_annotation.updated_at = now
                         existing_annotation.updated_by = regenerated_by
                     else:
                         # Create new
@@ -468,7 +574,7 @@ class AnalysisService:
                             description=description,
                             business_name=business_name,
                             is_ai_generated=True,
-                            ai_model_version=self.ai_generator.model,
+                            ai_model_version=model,
                             created_by=regenerated_by,
                         )
                         self.db.add(annotation)
@@ -477,18 +583,22 @@ class AnalysisService:
 
                 except Exception as e:
                     logger.error(
-                        f"Failed to create/update annotation for {field.field_path}: {e}",
-                        extra={"field_id": str(field.id)},
+                        "Failed to create/update annotation for %s: %s",
+                        field.field_path,
+                        e,
+                        extra={"field_id": field.id},
                     )
                     failed += 1
 
             logger.info(
-                f"Batch AI regeneration completed: {regenerated} successful, {failed} failed",
+                "Batch AI regeneration completed: %d successful, %d failed",
+                regenerated,
+                failed,
                 extra={"regenerated": regenerated, "failed": failed},
             )
 
         except Exception as e:
-            logger.error(f"Failed to generate AI descriptions in batch: {e}", exc_info=True)
+            logger.error("Failed to generate AI descriptions in batch: %s", e, exc_info=True)
             failed = len(fields)
 
         return {"regenerated": regenerated, "failed": failed}
@@ -515,32 +625,35 @@ class AnalysisService:
             NotFoundError: If version not found
             ProcessingError: If recalculation fails
         """
+        ver_str = str(version_id)
+
         logger.info(
-            f"Recalculating quality metrics for version {version_id}",
-            extra={"version_id": str(version_id)},
+            "Recalculating quality metrics for version %s",
+            ver_str,
+            extra={"version_id": ver_str},
         )
 
         # Get version
-        version = self.db.query(Version).filter(Version.id == str(version_id)).first()
+        version = self.db.query(Version).filter(Version.id == ver_str).first()
 
         if not version:
             raise NotFoundError(
                 f"Version not found: {version_id}",
-                details={"version_id": str(version_id)},
+                details={"version_id": ver_str},
             )
 
         # Get fields
         fields = (
             self.db.query(Field)
-            .filter(Field.version_id == str(version.id))
+            .filter(Field.version_id == ver_str)
             .order_by(Field.position)
             .all()
         )
 
         if not fields:
-            logger.warning(f"No fields found for version {version.id}")
+            logger.warning("No fields found for version %s", ver_str)
             return {
-                "version_id": str(version.id),
+                "version_id": ver_str,
                 "total_fields": 0,
                 "updated": 0,
                 "failed": 0,
@@ -548,75 +661,93 @@ class AnalysisService:
 
         updated = 0
         failed = 0
+        chunk_size = settings.batch_commit_size
+
+        # Chunk commits run with attribute expiry disabled: the session
+        # default expire_on_commit=True would otherwise expire every
+        # loaded Field at each chunk commit, and the next sample_values/
+        # data_type access would re-SELECT that row one query at a time
+        expire_prior = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            for field in fields:
+                try:
+                    # Extract sample values
+                    sample_values = (
+                        field.sample_values.get("values", []) if field.sample_values else []
+                    )
 
-        for field in fields:
-            try:
-                # Extract sample values
-                sample_values = (
-                    field.sample_values.get("values", []) if field.sample_values else []
-                )
-
-                # Recalculate metrics
-                quality_metrics = self.quality_analyzer.analyze_field(
-                    sample_values,
-                    field.data_type,
-                )
+                    # Recalculate metrics (the analyzer takes a vectorized
+                    # NumPy path for numeric fields)
+                    quality_metrics = self.quality_analyzer.analyze_field(
+                        sample_values,
+                        field.data_type,
+                    )
 
-                # Update field
-                field.total_count = quality_metrics.get("total_count", field.total_count)
-                field.null_count = quality_metrics.get("null_count", field.null_count)
-                field.null_percentage = quality_metrics.get(
-                    "null_percentage", field.null_percentage
-                )
-                field.distinct_count = quality_metrics.get(
-                    "distinct_count", field.distinct_count
-                )
-                field.cardinality_ratio = quality_metrics.get(
-                    "cardinality_ratio", field.cardinality_ratio
-                )
+                    # Update field
+                    field.total_count = quality_metrics.get("total_count", field.total_count)
+                    field.null_count = quality_metrics.get("null_count", field.null_count)
+                    field.null_percentage = quality_metrics.get(
+                        "null_percentage", field.null_percentage
+                    )
+                    field.distinct_count = quality_metrics.get(
+                        "distinct_count", field.distinct_count
+                    )
+                    field.cardinality_ratio = quality_metrics.get(
+                        "cardinality_ratio", field.cardinality_ratio
+                    )
 
-                # Update numeric metrics if available
-                if field.data_type in ("integer", "float"):
-                    field.min_value = quality_metrics.get("min_value")
-                    field.max_value = quality_metrics.get("max_value")
-                    field.mean_value = quality_metrics.get("mean_value")
-                    field.median_value = quality_metrics.get("median_value")
-                    field.std_dev = quality_metrics.get("std_dev")
-                    field.percentile_25 = quality_metrics.get("percentile_25")
-                    field.percentile_50 = quality_metrics.get("percentile_50")
-                    field.percentile_75 = quality_metrics.get("percentile_75")
+                    # Update numeric metrics if available
+                    for key in _EXTRA_KEYS_BY_TYPE.get(field.data_type, ()):
+                        setattr(field, key, quality_metrics.get(key))
 
-                updated += 1
+                    updated += 1
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to recalculate metrics for field {field.field_path}: {e}",
-                    extra={"field_id": str(field.id)},
+                except Exception as e:
+                    logger.error(
+                        "Failed to recalculate metrics for field %s: %s",
+                        field.field_path,
+                        e,
+                        extra={"field_id": field.id},
+                    )
+                    failed += 1
+                    continue
+
+                # Commit in chunks to bound transaction size and lock windows
+                # on versions with many fields
+                if updated % chunk_size == 0:
+                    try:
+                        self.db.commit()
+                    except Exception as e:
+                        self.db.rollback()
+                        logger.error("Failed to save quality metrics: %s", e)
+                        raise DatabaseError(f"Failed to save quality metrics: {str(e)}")
+
+            # Commit changes
+            try:
+                self.db.commit()
+                logger.info(
+                    "Quality metrics recalculated: %d fields",
+                    updated,
+                    extra={
+                        "version_id": ver_str,
+                        "updated": updated,
+                        "failed": failed,
+                    },
                 )
-                failed += 1
-
-        # Commit changes
-        try:
-            self.db.commit()
-            logger.info(
-                f"Quality metrics recalculated: {updated} fields",
-                extra={
-                    "version_id": str(version.id),
-                    "updated": updated,
-                    "failed": failed,
-                },
-            )
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"Failed to save quality metrics: {e}")
-            raise DatabaseError(f"Failed to save quality metrics: {str(e)}")
+            except Exception as e:
+                self.db.rollback()
+                logger.error("Failed to save quality metrics: %s", e)
+                raise DatabaseError(f"Failed to save quality metrics: {str(e)}")
+        finally:
+            self.db.expire_on_commit = expire_prior
 
         # Audit log
         audit_logger.info(
             "Quality metrics recalculated",
             extra={
                 "action": "recalculate_quality_metrics",
-                "version_id": str(version.id),
+                "version_id": ver_str,
                 "recalculated_by": recalculated_by,
                 "updated": updated,
                 "failed": failed,
@@ -624,7 +755,7 @@ class AnalysisService:
         )
 
         return {
-            "version_id": str(version.id),
+            "version_id": ver_str,
             "version_number": version.version_number,
             "total_fields": len(fields),
             "updated": updated,
@@ -647,60 +778,67 @@ class AnalysisService:
         Raises:
             NotFoundError: If version not found
         """
-        logger.debug(f"Getting field statistics for version {version_id}")
+        version_key = str(version_id)
+
+        logger.debug("Getting field statistics for version %s", version_key)
 
         # Get version
-        version = self.db.query(Version).filter(Version.id == str(version_id)).first()
+        version = self.db.query(Version).filter(Version.id == version_key).first()
 
         if not version:
             raise NotFoundError(
                 f"Version not found: {version_id}",
-                details={"version_id": str(version_id)},
+                details={"version_id": version_key},
             )
 
-        # Get fields
-        fields = self.db.query(Field).filter(Field.version_id == str(version.id)).all()
-
-        if not fields:
-            return {
-                "version_id": str(version.id),
-                "total_fields": 0,
-            }
+        # Aggregate in SQL so only a handful of rows cross the DB boundary
+        # instead of every Field row for the version
 
-        # Calculate statistics
-        type_distribution = {}
-        semantic_type_distribution = {}
-        pii_count = 0
-        nullable_count = 0
-        array_count = 0
-        total_null_percentage = 0.0
+        type_distribution = dict(
+            self.db.query(Field.data_type, func.count())
+            .filter(Field.version_id == version_key)
+            .group_by(Field.data_type)
+            .all()
+        )
 
-        for field in fields:
-            type_distribution[field.data_type] = (
-                type_distribution.get(field.data_type, 0) + 1
+        semantic_type_distribution = dict(
+            self.db.query(Field.semantic_type, func.count())
+            .filter(
+                Field.version_id == version_key,
+                Field.semantic_type.isnot(None),
             )
+            .group_by(Field.semantic_type)
+            .all()
+        )
 
-            if field.semantic_type:
-                semantic_type_distribution[field.semantic_type] = (
-                    semantic_type_distribution.get(field.semantic_type, 0) + 1
-                )
-
-            if field.is_pii:
-                pii_count += 1
-
-            if field.is_nullable:
-                nullable_count += 1
-
-            if field.is_array:
-                array_count += 1
+        (
+            num_fields,
+            pii_count,
+            nullable_count,
+            array_count,
+            total_null_percentage,
+        ) = (
+            self.db.query(
+                func.count(),
+                func.count().filter(Field.is_pii.is_(True)),
+                func.count().filter(Field.is_nullable.is_(True)),
+                func.count().filter(Field.is_array.is_(True)),
+                func.coalesce(func.sum(Field.null_percentage), 0),
+            )
+            .filter(Field.version_id == version_key)
+            .one()
+        )
 
-            if field.null_percentage:
-                total_null_percentage += float(field.null_percentage)
+        if num_fields == 0:
+            return {
+                "version_id": version_key,
+                "total_fields": 0,
+            }
 
-        num_fields = len(fields)
+        total_null_percentage = float(total_null_percentage)
 
         return {
-            "version_id": str(version.id),
+            "version_id": version_key,
             "version_number": version.version_number,
             "total_fields": num_fields,
             "type_distribution": type_distribution,
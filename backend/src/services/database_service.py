@@ -1,12 +1,15 @@
 """Database management service for stats, health checks, backup, and clear operations."""
+import asyncio
+import functools
 import logging
 import os
-import shutil
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 from sqlalchemy.orm import Session
 
 from src.core.config import settings
@@ -17,6 +20,125 @@ from src.models.version import Version
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL in-process cache for stats responses. Dashboards poll these
+# endpoints far more often than the underlying counts change.
+_stats_cache: dict[str, tuple[float, Any]] = {}
+_stats_cache_lock = threading.Lock()
+
+
+def _stats_cache_get(key: str) -> Any | None:
+    """Return a cached stats value if present and fresh, else None."""
+    ttl = settings.STATS_CACHE_TTL
+    if ttl <= 0:
+        return None
+    with _stats_cache_lock:
+        entry = _stats_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+    return None
+
+
+def _stats_cache_set(key: str, value: Any) -> None:
+    """Store a stats value with the current timestamp."""
+    if settings.STATS_CACHE_TTL <= 0:
+        return
+    with _stats_cache_lock:
+        _stats_cache[key] = (time.monotonic(), value)
+
+
+def invalidate_stats_cache() -> None:
+    """Drop all cached stats. Call after bulk writes or destructive operations."""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+@functools.cache
+def _resolve_sqlite_path() -> str | None:
+    """
+    Resolve the SQLite database file path from DATABASE_URL once.
+
+    Returns:
+        Absolute path to the database file, or None when the configured
+        database is not SQLite
+    """
+    if not settings.is_sqlite:
+        return None
+    return str(Path(settings.DATABASE_URL.removeprefix("sqlite:///")).resolve())
+
+
+def _fsync_dir(path: str) -> None:
+    """Flush directory metadata so a freshly renamed entry survives a crash."""
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file via in-kernel os.copy_file_range where available.
+
+    Avoids shutil's userspace read/write loop (and becomes a reflink on
+    CoW filesystems); falls back to a buffered copy on platforms or
+    filesystems that do not support it. Preserves metadata like copy2.
+    """
+    import shutil
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        try:
+            while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                pass
+        except (AttributeError, OSError):
+            # AttributeError: os.copy_file_range does not exist off Linux;
+            # OSError: EINVAL/ENOSYS/EXDEV etc. Either way restart with a
+            # userspace copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+    shutil.copystat(src, dst)
+
+
+# All four table counts in one statement, so stats calls cost a single
+# round-trip instead of four. Core select emits flat count(*) queries
+# (no ORM subquery wrap) and stays in sync with the model metadata.
+_COUNT_ALL_TABLES = select(
+    select(func.count()).select_from(Dictionary).scalar_subquery(),
+    select(func.count()).select_from(Version).scalar_subquery(),
+    select(func.count()).select_from(Field).scalar_subquery(),
+    select(func.count()).select_from(Annotation).scalar_subquery(),
+)
+
+# Most recent update across both timestamped tables, combined in SQL so
+# stats calls get one scalar back instead of running two queries and
+# max()-ing in Python. UNION ALL + outer max() is portable to SQLite,
+# which has no GREATEST().
+_LAST_UPDATED_SUBQ = (
+    select(func.max(Dictionary.updated_at).label("u"))
+    .union_all(select(func.max(Annotation.updated_at).label("u")))
+    .subquery()
+)
+_LAST_UPDATED = select(func.max(_LAST_UPDATED_SUBQ.c.u))
+
+# Health-check statements, constructed once so SQLAlchemy's compiled
+# statement cache can hit on every poll
+_SELECT_1 = text("SELECT 1")
+_INTEGRITY_CHECK = text("PRAGMA integrity_check")
+# Connectivity probe and stats folded into one statement: a PG health
+# check costs a single round-trip
+_PG_HEALTH_ALL = text(
+    """
+    SELECT
+        1 as ok,
+        pg_database_size(current_database()) as db_size,
+        pg_is_in_recovery() as is_replica,
+        (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()) as active_connections
+    """
+)
+
 
 class DatabaseService:
     """Service for database management operations."""
@@ -30,6 +152,15 @@ class DatabaseService:
         """
         self.db = db
 
+    def _count_all_tables(self) -> tuple[int, int, int, int]:
+        """
+        Count rows in all four tables with a single query.
+
+        Returns:
+            Tuple of (dictionaries, versions, fields, annotations) counts
+        """
+        return self.db.execute(_COUNT_ALL_TABLES).one()
+
     def get_database_stats(self) -> dict[str, Any]:
         """
         Get comprehensive database statistics.
@@ -43,6 +174,10 @@ class DatabaseService:
                 - total_records: Total records across all tables
                 - last_updated: Most recent update timestamp
         """
+        cached = _stats_cache_get("database_stats")
+        if cached is not None:
+            return cached
+
         stats = {
             "database_type": "sqlite" if settings.is_sqlite else "postgresql",
             "table_counts": {},
@@ -50,55 +185,35 @@ class DatabaseService:
             "last_updated": None,
         }
 
-        # Get record counts for each table
-        stats["table_counts"]["dictionaries"] = self.db.query(Dictionary).count()
-        stats["table_counts"]["versions"] = self.db.query(Version).count()
-        stats["table_counts"]["fields"] = self.db.query(Field).count()
-        stats["table_counts"]["annotations"] = self.db.query(Annotation).count()
+        # Get record counts for each table in one round-trip
+        dict_count, version_count, field_count, annotation_count = self._count_all_tables()
+        stats["table_counts"]["dictionaries"] = dict_count
+        stats["table_counts"]["versions"] = version_count
+        stats["table_counts"]["fields"] = field_count
+        stats["table_counts"]["annotations"] = annotation_count
 
         stats["total_records"] = sum(stats["table_counts"].values())
 
-        # Get most recent update timestamp
-        last_dict_update = (
-            self.db.query(Dictionary.updated_at)
-            .order_by(Dictionary.updated_at.desc())
-            .first()
-        )
-        last_annotation_update = (
-            self.db.query(Annotation.updated_at)
-            .order_by(Annotation.updated_at.desc())
-            .first()
-        )
-
-        if last_dict_update or last_annotation_update:
-            timestamps = [
-                ts
-                for ts in [
-                    last_dict_update[0] if last_dict_update else None,
-                    last_annotation_update[0] if last_annotation_update else None,
-                ]
-                if ts
-            ]
-            if timestamps:
-                stats["last_updated"] = max(timestamps)
+        # Get most recent update timestamp via aggregate pushdown; the
+        # cross-table max is combined in SQL, so one scalar comes back
+        # (None when both tables are empty)
+        stats["last_updated"] = self.db.execute(_LAST_UPDATED).scalar()
 
         # SQLite-specific stats
-        if settings.is_sqlite:
-            db_path = settings.DATABASE_URL.replace("sqlite:///", "")
-            # Handle relative paths
-            if not db_path.startswith("/"):
-                db_path = os.path.join(os.getcwd(), db_path)
-
+        db_path = _resolve_sqlite_path()
+        if db_path is not None:
             stats["database_path"] = db_path
 
-            if os.path.exists(db_path):
-                stats["database_size"] = os.path.getsize(db_path)
+            # One stat(2) call covers both the existence check and the size
+            try:
+                stats["database_size"] = os.stat(db_path).st_size
                 stats["database_size_mb"] = round(stats["database_size"] / (1024 * 1024), 2)
-            else:
+            except FileNotFoundError:
                 stats["database_size"] = 0
                 stats["database_size_mb"] = 0
 
         logger.info(f"Database stats retrieved: {stats['total_records']} total records")
+        _stats_cache_set("database_stats", stats)
         return stats
 
     def get_database_health(self) -> dict[str, Any]:
@@ -119,15 +234,13 @@ class DatabaseService:
         }
 
         try:
-            # Test connection with simple query
-            result = self.db.execute(text("SELECT 1"))
-            result.fetchone()
-            health["connection"] = True
-            logger.debug("Database connection test passed")
-
-            # SQLite-specific integrity check
             if settings.is_sqlite:
-                integrity_result = self.db.execute(text("PRAGMA integrity_check"))
+                # Test connection with simple query
+                self.db.execute(_SELECT_1).fetchone()
+                health["connection"] = True
+                logger.debug("Database connection test passed")
+
+                integrity_result = self.db.execute(_INTEGRITY_CHECK)
                 integrity = integrity_result.fetchone()[0]
                 health["integrity"] = integrity == "ok"
                 if integrity != "ok":
@@ -135,30 +248,16 @@ class DatabaseService:
                     health["integrity_details"] = integrity
                     logger.warning(f"SQLite integrity check failed: {integrity}")
             else:
-                # PostgreSQL: Enhanced health check
-                try:
-                    # Check if database is accepting connections
-                    self.db.execute(text("SELECT COUNT(*) FROM dictionaries"))
-
-                    # Check database stats for additional health information
-                    stats_query = text("""
-                        SELECT
-                            pg_database_size(current_database()) as db_size,
-                            pg_is_in_recovery() as is_replica,
-                            (SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()) as active_connections
-                    """)
-                    stats = self.db.execute(stats_query).fetchone()
-
-                    health["integrity"] = True
-                    health["database_size_bytes"] = stats[0] if stats else None
-                    health["is_replica"] = stats[1] if stats else False
-                    health["active_connections"] = stats[2] if stats else None
-
-                    logger.debug(f"PostgreSQL health: size={stats[0]}, connections={stats[2]}")
-                except Exception as pg_error:
-                    # If detailed stats fail, just mark integrity as true if basic query works
-                    health["integrity"] = True
-                    logger.debug(f"PostgreSQL detailed stats unavailable: {pg_error}")
+                # PostgreSQL: connectivity probe and stats in one statement;
+                # if the combined query fails, the database is unhealthy
+                row = self.db.execute(_PG_HEALTH_ALL).one()
+                health["connection"] = True
+                health["integrity"] = True
+                health["database_size_bytes"] = row[1]
+                health["is_replica"] = row[2]
+                health["active_connections"] = row[3]
+
+                logger.debug("PostgreSQL health: size=%s, connections=%s", row[1], row[3])
 
         except Exception as e:
             health["status"] = "unhealthy"
@@ -188,20 +287,49 @@ class DatabaseService:
         }
 
         try:
-            # Count records before deletion
-            deleted_counts["dictionaries"] = self.db.query(Dictionary).count()
-            deleted_counts["versions"] = self.db.query(Version).count()
-            deleted_counts["fields"] = self.db.query(Field).count()
-            deleted_counts["annotations"] = self.db.query(Annotation).count()
-
-            # Delete all records (cascade will handle relationships)
-            # Delete in reverse order of dependencies
-            self.db.query(Annotation).delete()
-            self.db.query(Field).delete()
-            self.db.query(Version).delete()
-            self.db.query(Dictionary).delete()
-
-            self.db.commit()
+            # Count records before deletion (single round-trip)
+            (
+                deleted_counts["dictionaries"],
+                deleted_counts["versions"],
+                deleted_counts["fields"],
+                deleted_counts["annotations"],
+            ) = self._count_all_tables()
+
+            if settings.is_postgresql:
+                # TRUNCATE is a metadata operation: O(1) regardless of
+                # row count, CASCADE covers the FK relationships, and no
+                # per-row FK validation happens
+                self.db.execute(
+                    text(
+                        "TRUNCATE TABLE annotations, fields, versions, dictionaries "
+                        "RESTART IDENTITY CASCADE"
+                    )
+                )
+                self.db.commit()
+            else:
+                # SQLite has no TRUNCATE; issue plain DELETEs in reverse
+                # dependency order, skipping ORM unit-of-work bookkeeping.
+                # FK enforcement is switched off for the wipe so SQLite
+                # skips per-row referencing checks — the pragma is a no-op
+                # inside an open transaction, but the pysqlite driver only
+                # begins one before DML, so it lands ahead of the first
+                # DELETE. Restored in the finally: the engine's StaticPool
+                # reuses this connection across requests.
+                self.db.execute(text("PRAGMA foreign_keys = OFF"))
+                try:
+                    self.db.execute(text("DELETE FROM annotations"))
+                    self.db.execute(text("DELETE FROM fields"))
+                    self.db.execute(text("DELETE FROM versions"))
+                    self.db.execute(text("DELETE FROM dictionaries"))
+                    self.db.commit()
+                except Exception:
+                    self.db.rollback()
+                    raise
+                finally:
+                    self.db.execute(text("PRAGMA foreign_keys = ON"))
+
+            # Cached counts are stale after a wipe
+            invalidate_stats_cache()
 
             logger.warning(
                 f"Database cleared: {sum(deleted_counts.values())} records deleted"
@@ -219,19 +347,29 @@ class DatabaseService:
             logger.error(f"Failed to clear database: {e}")
             raise
 
-    def backup_database(self, backup_dir: str | None = None) -> dict[str, Any]:
+    def backup_database(
+        self, backup_dir: str | None = None, compress: bool = True
+    ) -> dict[str, Any]:
         """
         Create a backup of the database.
 
-        For SQLite: Copies the database file
+        For SQLite: Copies the database file (gzip-compressed by default;
+        SQLite pages compress very well, so this cuts disk I/O several-fold)
         For PostgreSQL: Would need pg_dump (not implemented)
 
         Args:
             backup_dir: Directory to store backup (optional)
+            compress: If True, write a .db.gz file instead of a raw copy
 
         Returns:
             dict: Backup information including path and size
         """
+        # Backup-only dependencies: imported here so app startup does not
+        # pay for them (this module loads with the API routers)
+        import gzip
+        import shutil
+        import sqlite3
+
         if not settings.is_sqlite:
             raise NotImplementedError(
                 "Backup is currently only supported for SQLite databases. "
@@ -245,23 +383,72 @@ class DatabaseService:
         backup_path = Path(backup_dir)
         backup_path.mkdir(parents=True, exist_ok=True)
 
-        # Get source database path
-        db_path = settings.DATABASE_URL.replace("sqlite:///", "")
-        if not db_path.startswith("/"):
-            db_path = os.path.join(os.getcwd(), db_path)
+        # Get source database path (resolved once per process)
+        db_path = _resolve_sqlite_path()
 
-        if not os.path.exists(db_path):
+        try:
+            os.stat(db_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Database file not found: {db_path}")
 
-        # Create backup filename with timestamp
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"database_backup_{timestamp}.db"
-        backup_file_path = backup_path / backup_filename
-
-        # Copy database file
-        shutil.copy2(db_path, backup_file_path)
-
-        backup_size = os.path.getsize(backup_file_path)
+        # Create backup filename with timestamp; read the clock once and
+        # reuse it for created_at so the two always agree
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        raw_file_path = backup_path / f"database_backup_{timestamp}.db"
+        backup_file_path = (
+            raw_file_path.with_suffix(".db.gz") if compress else raw_file_path
+        )
+        # Write to a .partial name and publish with an atomic rename, so a
+        # crash mid-backup can never leave a truncated file under the
+        # final name
+        partial_path = backup_file_path.with_name(backup_file_path.name + ".partial")
+        raw_write_path = partial_path if not compress else raw_file_path
+
+        # Use SQLite's online backup API: a page-by-page copy that
+        # coordinates with the WAL, so the backup is consistent even if
+        # writes are in flight (shutil.copy2 of a live file is not)
+        src = sqlite3.connect(db_path)
+        dst = sqlite3.connect(str(raw_write_path))
+        try:
+            with dst:
+                src.backup(dst, pages=1024)
+        except sqlite3.Error as e:
+            # Fall back to a file-level copy (only safe while writes are
+            # quiesced); _fast_copy uses an in-kernel copy where possible
+            logger.warning(f"Online backup failed ({e}); falling back to file copy")
+            raw_write_path.unlink(missing_ok=True)
+            _fast_copy(db_path, str(raw_write_path))
+        finally:
+            dst.close()
+            src.close()
+
+        uncompressed_size = os.stat(raw_write_path).st_size
+
+        if compress:
+            # Stream the raw pages through gzip in 1 MiB chunks; fsync the
+            # partial file before it is renamed into place
+            with open(raw_write_path, "rb") as fsrc, open(partial_path, "wb") as fraw:
+                with gzip.GzipFile(
+                    filename="", mode="wb", fileobj=fraw, compresslevel=6
+                ) as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+                fraw.flush()
+                os.fsync(fraw.fileno())
+            os.remove(raw_write_path)
+        else:
+            fd = os.open(partial_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        # Atomic publish: rename the durable partial file, then flush the
+        # directory entry itself
+        os.replace(partial_path, backup_file_path)
+        _fsync_dir(str(backup_path))
+
+        backup_size = os.stat(backup_file_path).st_size
 
         logger.info(f"Database backup created: {backup_file_path} ({backup_size} bytes)")
 
@@ -270,9 +457,30 @@ class DatabaseService:
             "backup_path": str(backup_file_path),
             "backup_size": backup_size,
             "backup_size_mb": round(backup_size / (1024 * 1024), 2),
-            "created_at": datetime.now(timezone.utc),
+            "uncompressed_size": uncompressed_size,
+            "compressed": compress,
+            "created_at": now,
         }
 
+    async def backup_database_async(
+        self, backup_dir: str | None = None, compress: bool = True
+    ) -> dict[str, Any]:
+        """
+        Create a database backup without blocking the event loop.
+
+        The file copy and compression in backup_database are blocking I/O
+        that can take seconds on a large database; running them in a worker
+        thread keeps other requests responsive.
+
+        Args:
+            backup_dir: Directory to store backup (optional)
+            compress: If True, write a .db.gz file instead of a raw copy
+
+        Returns:
+            dict: Backup information including path and size
+        """
+        return await asyncio.to_thread(self.backup_database, backup_dir, compress)
+
     def get_table_statistics(self) -> dict[str, Any]:
         """
         Get detailed statistics for each table.
@@ -280,17 +488,22 @@ class DatabaseService:
         Returns:
             dict: Per-table statistics including row counts and storage info
         """
+        cached = _stats_cache_get("table_statistics")
+        if cached is not None:
+            return cached
+
         tables_stats = {}
 
+        # All row counts in a single round-trip
+        dict_count, version_count, field_count, annotation_count = self._count_all_tables()
+
         # Dictionaries table stats
-        dict_count = self.db.query(Dictionary).count()
         tables_stats["dictionaries"] = {
             "row_count": dict_count,
             "columns": 10,
         }
 
         # Versions table stats
-        version_count = self.db.query(Version).count()
         avg_versions_per_dict = version_count / dict_count if dict_count > 0 else 0
         tables_stats["versions"] = {
             "row_count": version_count,
@@ -299,7 +512,6 @@ class DatabaseService:
         }
 
         # Fields table stats
-        field_count = self.db.query(Field).count()
         avg_fields_per_version = field_count / version_count if version_count > 0 else 0
         tables_stats["fields"] = {
             "row_count": field_count,
@@ -308,7 +520,6 @@ class DatabaseService:
         }
 
         # Annotations table stats
-        annotation_count = self.db.query(Annotation).count()
         avg_annotations_per_field = (
             annotation_count / field_count if field_count > 0 else 0
         )
@@ -318,4 +529,5 @@ class DatabaseService:
             "avg_per_field": round(avg_annotations_per_field, 2),
         }
 
+        _stats_cache_set("table_statistics", tables_stats)
         return tables_stats
@@ -8,11 +8,17 @@ workflow for creating, managing, and analyzing data dictionaries.
 import asyncio
 import hashlib
 import logging
+import os
+import re
+from dataclasses import dataclass
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.core.exceptions import (
@@ -41,6 +47,42 @@ from src.processors.xml_parser import XMLParser
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# MongoDB Extended JSON type markers ($oid, $date, ...), combined into one
+# precompiled alternation so format detection scans the sample buffer once
+_MONGO_MARKER_RE = re.compile(rb'"\$(?:oid|date|numberLong|numberDecimal|binary)"')
+
+# Parser dispatch by file suffix: a single dict lookup instead of an
+# if/elif chain per request. JSON is handled separately because it needs
+# MongoDB-format detection first.
+_PARSER_DISPATCH = {
+    ".xml": lambda self, path: self.xml_parser.parse_file(path),
+    ".gpkg": lambda self, path: self.geopackage_parser.parse_file(path),
+    ".db": lambda self, path: self.sqlite_parser.parse_file(path),
+    ".sqlite": lambda self, path: self.sqlite_parser.parse_file(path),
+    ".sqlite3": lambda self, path: self.sqlite_parser.parse_file(path),
+    ".proto": lambda self, path: ProtobufParser(str(path)).parse_file(path),
+    ".desc": lambda self, path: ProtobufParser(str(path)).parse_file(path),
+}
+
+_SUPPORTED_SUFFIXES = {".json", *_PARSER_DISPATCH}
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzedField:
+    """
+    Per-field analysis results handed from _analyze_field to _process_field.
+
+    Slotted and frozen: thousands of these exist at once on wide schemas,
+    and slots keep them dict-free and cheap to read.
+    """
+
+    data_type: str
+    confidence: float
+    semantic_type: str | None
+    is_pii: bool
+    pii_type: str | None
+    quality_metrics: dict[str, Any]
+
 
 class DictionaryService:
     """
@@ -68,8 +110,13 @@ class DictionaryService:
         """
         self.db = db
 
-        # Initialize processors
+        # Initialize processors (parsers are reused across calls so any
+        # setup cost is paid once per service, not once per file)
         self.json_parser = JSONParser()
+        self.mongodb_parser = MongoDBParser()
+        self.xml_parser = XMLParser()
+        self.geopackage_parser = GeoPackageParser()
+        self.sqlite_parser = SQLiteParser()
         self.type_inferrer = TypeInferrer()
         self.ai_generator = AIDescriptionGenerator()
         # Pass AI generator to semantic detector for enhanced detection
@@ -88,6 +135,8 @@ class DictionaryService:
         generate_ai_descriptions: bool = False,
         metadata: dict[str, Any] | None = None,
         original_filename: str | None = None,
+        file_format_hint: str | None = None,
+        defer_ai_annotations: bool = False,
     ) -> Dictionary:
         """
         Create dictionary from JSON, XML, SQLite, or GeoPackage file.
@@ -108,6 +157,11 @@ class DictionaryService:
             generate_ai_descriptions: Whether to generate AI descriptions
             metadata: Additional metadata
             original_filename: Original uploaded filename (if different from file_path.name)
+            file_format_hint: "json" or "mongodb" to skip format sniffing
+                when the caller already knows the JSON flavor
+            defer_ai_annotations: Skip the inline AI step and let the
+                caller run generate_ai_annotations in the background, so
+                the dictionary returns without waiting on the LLM
 
         Returns:
             Dictionary: Created dictionary with version and fields
@@ -123,42 +177,38 @@ class DictionaryService:
         )
 
         try:
-            # Validate file
-            if not file_path.exists():
+            # Validate file; one stat(2) covers both the existence check
+            # and the size recorded on the dictionary below
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
                 raise ValidationError(f"File not found: {file_path}")
 
             file_suffix = file_path.suffix.lower()
-            if file_suffix not in [".json", ".xml", ".db", ".sqlite", ".sqlite3", ".gpkg", ".proto", ".desc"]:
+            if file_suffix not in _SUPPORTED_SUFFIXES:
                 raise ValidationError("File must be a JSON, XML, SQLite, GeoPackage, or Protocol Buffer file")
 
             # Step 1: Parse file based on format
             try:
-                if file_suffix == ".xml":
-                    logger.info("Parsing XML file")
-                    xml_parser = XMLParser()
-                    parse_result = xml_parser.parse_file(file_path)
-                elif file_suffix == ".gpkg":
-                    logger.info("Parsing GeoPackage file")
-                    geopackage_parser = GeoPackageParser()
-                    parse_result = geopackage_parser.parse_file(file_path)
-                elif file_suffix in [".db", ".sqlite", ".sqlite3"]:
-                    logger.info("Parsing SQLite database file")
-                    sqlite_parser = SQLiteParser()
-                    parse_result = sqlite_parser.parse_file(file_path)
-                elif file_suffix in [".proto", ".desc"]:
-                    logger.info(f"Parsing Protocol Buffer {file_suffix} file")
-                    protobuf_parser = ProtobufParser(str(file_path))
-                    parse_result = protobuf_parser.parse_file(file_path)
+                parse = _PARSER_DISPATCH.get(file_suffix)
+                if parse is not None:
+                    logger.info("Parsing %s file", file_suffix)
+                    parse_result = parse(self, file_path)
                 else:
-                    # JSON file - detect MongoDB Extended JSON format
+                    # JSON file - detect MongoDB Extended JSON format,
+                    # unless a hint (parameter or upload metadata) already
+                    # settled it and the sniffing read can be skipped
                     logger.info("Parsing JSON file")
-                    is_mongodb_format = self._detect_mongodb_format(file_path)
+                    format_hint = file_format_hint or (metadata or {}).get("format_hint")
+                    if format_hint in ("json", "mongodb"):
+                        is_mongodb_format = format_hint == "mongodb"
+                    else:
+                        is_mongodb_format = self._detect_mongodb_format(file_path)
 
                     # Use appropriate parser
                     if is_mongodb_format:
                         logger.info("Using MongoDB Extended JSON parser")
-                        mongodb_parser = MongoDBParser()
-                        parse_result = mongodb_parser.parse_file(file_path)
+                        parse_result = self.mongodb_parser.parse_file(file_path)
                     else:
                         parse_result = self.json_parser.parse_file(file_path)
             except Exception as e:
@@ -174,7 +224,7 @@ class DictionaryService:
                 name=name,
                 description=description,
                 source_file_name=original_filename or file_path.name,
-                source_file_size=file_path.stat().st_size,
+                source_file_size=file_size,
                 total_records_analyzed=parse_result["total_records"],
                 created_by=created_by,
                 metadata=metadata,
@@ -190,16 +240,19 @@ class DictionaryService:
             # Step 3: Create version
             logger.info("Creating version record")
             schema_hash = self._calculate_schema_hash(parse_result["fields"])
+            processing_stats = {
+                "total_fields": len(parse_result["fields"]),
+                "total_records": parse_result["total_records"],
+                "is_array_root": parse_result["is_array"],
+            }
+            if generate_ai_descriptions and defer_ai_annotations:
+                processing_stats["ai_annotation_status"] = "pending"
             version = Version(
                 dictionary_id=dictionary.id,
                 version_number=1,
                 schema_hash=schema_hash,
                 created_by=created_by,
-                processing_stats={
-                    "total_fields": len(parse_result["fields"]),
-                    "total_records": parse_result["total_records"],
-                    "is_array_root": parse_result["is_array"],
-                },
+                processing_stats=processing_stats,
             )
 
             try:
@@ -211,26 +264,36 @@ class DictionaryService:
 
             # Step 4: Process fields
             logger.info(f"Processing {len(parse_result['fields'])} fields")
-            fields_created = 0
+            new_fields = []  # Accumulated for a single bulk insert
             processed_fields = []  # Store (field, field_meta) tuples for batch AI processing
 
             # Enable AI-enhanced semantic detection if AI descriptions are enabled
             self.semantic_detector.use_ai = generate_ai_descriptions
 
-            for position, field_meta in enumerate(parse_result["fields"]):
+            # Fields are independent, so the CPU-bound analyzers run across
+            # a thread pool; session access stays on this thread
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                analysis_futures = [
+                    executor.submit(self._analyze_field, field_meta)
+                    for field_meta in parse_result["fields"]
+                ]
+
+            for position, (field_meta, future) in enumerate(
+                zip(parse_result["fields"], analysis_futures)
+            ):
                 try:
                     field = self._process_field(
                         version=version,
                         field_meta=field_meta,
                         position=position,
+                        analysis=future.result(),
                     )
+                    new_fields.append(field)
 
                     # Store for batch AI processing
                     if generate_ai_descriptions:
                         processed_fields.append((field, field_meta))
 
-                    fields_created += 1
-
                 except Exception as e:
                     logger.error(
                         f"Failed to process field {field_meta['field_path']}: {e}",
@@ -238,8 +301,15 @@ class DictionaryService:
                     )
                     # Continue processing other fields
 
-            # Step 5: Generate AI descriptions in batch (if enabled)
-            if generate_ai_descriptions and processed_fields:
+            # Persist all fields in one batch: IDs are assigned at
+            # construction, so nothing needs an early flush and the ORM
+            # emits executemany inserts at commit time
+            self.db.add_all(new_fields)
+            fields_created = len(new_fields)
+
+            # Step 5: Generate AI descriptions in batch (if enabled and not
+            # deferred to a background job)
+            if generate_ai_descriptions and not defer_ai_annotations and processed_fields:
                 logger.info(f"Generating AI descriptions for {len(processed_fields)} fields")
                 try:
                     asyncio.run(self._generate_ai_annotations_batch(processed_fields))
@@ -286,23 +356,25 @@ class DictionaryService:
             logger.error(f"Unexpected error creating dictionary: {e}", exc_info=True)
             raise ProcessingError(f"Unexpected error: {str(e)}")
 
-    def _process_field(
-        self,
-        version: Version,
-        field_meta: dict[str, Any],
-        position: int,
-    ) -> Field:
+    def _analyze_field(self, field_meta: dict[str, Any]) -> AnalyzedField:
         """
-        Process a single field through all analysis steps.
+        Run all analyzers for a single field.
+
+        Pure computation over the parsed metadata — no session access — so
+        it is safe to run concurrently across fields.
 
         Args:
-            version: Version to attach field to
             field_meta: Field metadata from parser
-            position: Position in field list
 
         Returns:
-            Field: Created field record
+            AnalyzedField: Analysis results (type, semantic type, PII
+            flags, quality metrics)
         """
+        # Bind repeated lookups once
+        field_path = field_meta["field_path"]
+        field_name = field_meta["field_name"]
+        sample_values = field_meta["sample_values"]
+
         # Infer type
         data_type, confidence = self.type_inferrer.infer_type(
             field_meta["types_seen"]
@@ -310,53 +382,94 @@ class DictionaryService:
 
         # Detect semantic type
         semantic_type = self.semantic_detector.detect(
-            field_meta["field_name"],
-            field_meta["sample_values"],
+            field_name,
+            sample_values,
             data_type,
         )
 
         # Detect PII
         is_pii, pii_type = self.pii_detector.detect_pii(
-            field_meta["field_path"],
-            field_meta["field_name"],
+            field_path,
+            field_name,
             semantic_type,
-            field_meta["sample_values"],
+            sample_values,
         )
 
         # Calculate quality metrics
         quality_metrics = self.quality_analyzer.analyze_field(
-            field_meta["sample_values"],
+            sample_values,
             data_type,
         )
 
-        # Determine nullability
-        null_percentage = field_meta.get("null_percentage", 0)
+        return AnalyzedField(
+            data_type=data_type,
+            confidence=confidence,
+            semantic_type=semantic_type,
+            is_pii=is_pii,
+            pii_type=pii_type,
+            quality_metrics=quality_metrics,
+        )
+
+    def _process_field(
+        self,
+        version: Version,
+        field_meta: dict[str, Any],
+        position: int,
+        analysis: AnalyzedField | None = None,
+    ) -> Field:
+        """
+        Build a Field record from parsed metadata and analysis results.
+
+        Args:
+            version: Version to attach field to
+            field_meta: Field metadata from parser
+            position: Position in field list
+            analysis: Precomputed _analyze_field output (computed here
+                when not supplied)
+
+        Returns:
+            Field: Unsaved field record; the caller persists the whole
+            batch in a single flush
+        """
+        if analysis is None:
+            analysis = self._analyze_field(field_meta)
+
+        data_type = analysis.data_type
+        quality_metrics = analysis.quality_metrics
+
+        # Bind field_meta entries once: LOAD_FAST per use instead of a
+        # dict lookup, which adds up on 10k-field schemas
+        meta_get = field_meta.get
+        null_percentage = meta_get("null_percentage", 0)
         is_nullable = null_percentage > 0
 
         # Handle array types
-        is_array = field_meta.get("is_array", False)
+        is_array = meta_get("is_array", False)
         array_item_type = None
-        if is_array and field_meta.get("array_item_types"):
+        array_item_types = meta_get("array_item_types")
+        if is_array and array_item_types:
             array_item_type = self.type_inferrer.infer_array_item_type(
-                list(field_meta["array_item_types"])
+                list(array_item_types)
             )
 
-        # Create field record
+        # Create field record with the primary key assigned up front, so
+        # annotations can reference field.id without a flush
         field = Field(
+            id=str(uuid4()),
             version_id=version.id,
             field_path=field_meta["field_path"],
             field_name=field_meta["field_name"],
             parent_path=field_meta["parent_path"] or None,
             nesting_level=field_meta["nesting_level"],
             data_type=data_type,
-            semantic_type=semantic_type,
+            semantic_type=analysis.semantic_type,
             is_nullable=is_nullable,
             is_array=is_array,
             array_item_type=array_item_type,
             sample_values={"values": field_meta["sample_values"]},
-            null_count=field_meta.get("null_count", 0),
+            null_count=meta_get("null_count", 0),
             null_percentage=null_percentage,
-            total_count=quality_metrics.get("total_count", field_meta.get("total_count", 0)),
+            total_count=quality_metrics.get("total_count", meta_get("total_count", 0)),
             distinct_count=quality_metrics.get("distinct_count", 0),
             cardinality_ratio=quality_metrics.get("cardinality_ratio"),
             min_value=quality_metrics.get("min_value"),
@@ -367,15 +480,12 @@ class DictionaryService:
             percentile_25=quality_metrics.get("percentile_25"),
             percentile_50=quality_metrics.get("percentile_50"),
             percentile_75=quality_metrics.get("percentile_75"),
-            is_pii=is_pii,
-            pii_type=pii_type,
-            confidence_score=confidence,
+            is_pii=analysis.is_pii,
+            pii_type=analysis.pii_type,
+            confidence_score=analysis.confidence,
             position=position,
         )
 
-        self.db.add(field)
-        self.db.flush()  # Get field ID
-
         return field
 
     async def _generate_ai_annotations_batch(
@@ -409,18 +519,24 @@ class DictionaryService:
             # Generate descriptions in batch (concurrent)
             results = await self.ai_generator.generate_batch(batch_input)
 
+            # Hoisted loop invariants: one attribute lookup and one clock
+            # read for the whole batch instead of per annotation
+            model_version = self.ai_generator.model
+            now = datetime.now(timezone.utc)
+
             # Create annotations
             for (field, field_meta), (description, business_name) in zip(
                 processed_fields, results
             ):
                 try:
                     annotation = Annotation(
+                        id=str(uuid4()),
                         field_id=field.id,
                         description=description,
                         business_name=business_name,
                         is_ai_generated=True,
-                        ai_model_version=self.ai_generator.model,
-                        created_at=datetime.now(timezone.utc),
+                        ai_model_version=model_version,
+                        created_at=now,
                     )
 
                     self.db.add(annotation)
@@ -451,6 +567,63 @@ class DictionaryService:
             logger.error(f"Failed to generate AI annotations in batch: {e}", exc_info=True)
             return annotations_created
 
+    def generate_ai_annotations(self, version_id: UUID | str) -> int:
+        """
+        Generate AI annotations for all fields of a committed version.
+
+        Designed to run outside the upload request (e.g. as a FastAPI
+        background task with its own session) so dictionary creation does
+        not block on LLM round-trips. Progress is tracked via the
+        ai_annotation_status key in the version's processing_stats.
+
+        Args:
+            version_id: Version UUID
+
+        Returns:
+            Number of annotations created
+        """
+        version = (
+            self.db.query(Version).filter(Version.id == str(version_id)).first()
+        )
+        if not version:
+            logger.warning(f"Version not found for AI annotation: {version_id}")
+            return 0
+
+        fields = self.db.query(Field).filter(Field.version_id == version.id).all()
+        processed_fields = [
+            (
+                field,
+                {
+                    "field_path": field.field_path,
+                    "field_name": field.field_name,
+                    "sample_values": (field.sample_values or {}).get("values", []),
+                },
+            )
+            for field in fields
+        ]
+
+        try:
+            annotations = []
+            if processed_fields:
+                annotations = asyncio.run(
+                    self._generate_ai_annotations_batch(processed_fields)
+                )
+            version.processing_stats = {
+                **(version.processing_stats or {}),
+                "ai_annotation_status": "completed",
+            }
+            self.db.commit()
+            return len(annotations)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Background AI annotation failed for {version_id}: {e}")
+            version.processing_stats = {
+                **(version.processing_stats or {}),
+                "ai_annotation_status": "failed",
+            }
+            self.db.commit()
+            return 0
+
     def _calculate_schema_hash(self, fields: list[dict[str, Any]]) -> str:
         """
         Calculate hash of schema structure for version detection.
@@ -461,17 +634,20 @@ class DictionaryService:
         Returns:
             SHA256 hash of schema structure
         """
-        # Create deterministic representation
-        field_signatures = []
-        for field in sorted(fields, key=lambda x: x["field_path"]):
+        # Stream signatures into the hasher in sorted order: no signature
+        # list, no join, and no full-schema string/bytes copy. The byte
+        # sequence matches the old "|".join form exactly, so stored
+        # schema hashes stay comparable.
+        hasher = hashlib.sha256()
+        update = hasher.update  # hoisted: one bound-method lookup, not N
+        for index, field in enumerate(sorted(fields, key=itemgetter("field_path"))):
             # Include path and primary type in signature
-            types = field.get("types_seen", [])
+            types = field.get("types_seen")
             primary_type = types[0] if types else "unknown"
-            sig = f"{field['field_path']}:{primary_type}"
-            field_signatures.append(sig)
-
-        schema_str = "|".join(field_signatures)
-        return hashlib.sha256(schema_str.encode()).hexdigest()
+            if index:
+                update(b"|")
+            update(f"{field['field_path']}:{primary_type}".encode())
+        return hasher.hexdigest()
 
     def _detect_mongodb_format(self, file_path: Path) -> bool:
         """
@@ -485,20 +661,17 @@ class DictionaryService:
         Returns:
             True if MongoDB markers are detected, False otherwise
         """
-        mongodb_markers = {b'"$oid"', b'"$date"', b'"$numberLong"', b'"$numberDecimal"', b'"$binary"'}
-
         try:
             with open(file_path, 'rb') as f:
                 # Read first 8KB
                 sample = f.read(8192)
 
-                # Check for any MongoDB markers
-                for marker in mongodb_markers:
-                    if marker in sample:
-                        logger.info(f"MongoDB Extended JSON format detected in {file_path.name}")
-                        return True
+            # One pass over the buffer for all markers
+            if _MONGO_MARKER_RE.search(sample):
+                logger.info(f"MongoDB Extended JSON format detected in {file_path.name}")
+                return True
 
-                return False
+            return False
 
         except Exception as e:
             logger.warning(f"Error detecting MongoDB format: {e}")
@@ -539,15 +712,22 @@ class DictionaryService:
         offset: int = 0,
         sort_by: str = "created_at",
         order: str = "desc",
+        load_fields: bool = False,
     ) -> tuple[list[Dictionary], int]:
         """
         List dictionaries with pagination.
 
+        Each returned dictionary carries a latest_field_count attribute;
+        by default it comes from a grouped COUNT query rather than
+        hydrating every Field row of the page.
+
         Args:
             limit: Maximum number of results
             offset: Number of results to skip
             sort_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            load_fields: Eagerly load Field rows for every version
+                (expensive; only for callers that render the fields)
 
         Returns:
             Tuple of (list of dictionaries, total count)
@@ -558,14 +738,17 @@ class DictionaryService:
 
         from sqlalchemy.orm import selectinload
 
-        # Build query with eager loading to prevent N+1 queries
-        query = self.db.query(Dictionary).options(
-            selectinload(Dictionary.versions).selectinload(Version.fields)
+        # Build query with eager loading to prevent N+1 queries; the total
+        # rides along as COUNT(*) OVER () in the same statement, saving a
+        # separate COUNT round-trip and table scan. Fields are only
+        # hydrated on request — a list page needs counts, not rows.
+        version_loader = selectinload(Dictionary.versions)
+        if load_fields:
+            version_loader = version_loader.selectinload(Version.fields)
+        query = self.db.query(Dictionary, func.count().over().label("total")).options(
+            version_loader
         )
 
-        # Get total count before pagination
-        total = query.count()
-
         # Apply sorting
         if hasattr(Dictionary, sort_by):
             sort_column = getattr(Dictionary, sort_by)
@@ -578,9 +761,44 @@ class DictionaryService:
             query = query.order_by(Dictionary.created_at.desc())
 
         # Apply pagination
-        query = query.limit(limit).offset(offset)
+        rows = query.limit(limit).offset(offset).all()
+
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: fall back to a count so callers still see
+            # the true total
+            total = self.db.query(func.count(Dictionary.id)).scalar()
+        else:
+            total = 0
+
+        dictionaries = [row[0] for row in rows]
+
+        # Attach latest_field_count: from already-loaded rows when
+        # load_fields is set, otherwise via one grouped COUNT over just
+        # the page's latest versions
+        if load_fields:
+            for dictionary in dictionaries:
+                versions = dictionary.versions
+                dictionary.latest_field_count = len(versions[-1].fields) if versions else 0
+        else:
+            latest_ids = [d.versions[-1].id for d in dictionaries if d.versions]
+            counts = {}
+            if latest_ids:
+                counts = dict(
+                    self.db.execute(
+                        select(Field.version_id, func.count())
+                        .where(Field.version_id.in_(latest_ids))
+                        .group_by(Field.version_id)
+                    ).all()
+                )
+            for dictionary in dictionaries:
+                versions = dictionary.versions
+                dictionary.latest_field_count = (
+                    counts.get(versions[-1].id, 0) if versions else 0
+                )
 
-        return query.all(), total
+        return dictionaries, total
 
     def update_dictionary(
         self,
@@ -702,41 +920,51 @@ class DictionaryService:
 
         dictionary = self.get_dictionary(dictionary_id)
 
-        # Get version count
-        version_count = (
-            self.db.query(Version)
-            .filter(Version.dictionary_id == str(dictionary_id))
-            .count()
-        )
+        dict_str = str(dictionary_id)
 
-        # Get latest version
-        latest_version = (
-            self.db.query(Version)
-            .filter(Version.dictionary_id == str(dictionary_id))
+        # Latest version expressed as correlated scalar subqueries, so the
+        # version count, latest version number, and both field counts come
+        # back in a single round-trip instead of four
+        latest_version_id = (
+            select(Version.id)
+            .where(Version.dictionary_id == dict_str)
             .order_by(Version.version_number.desc())
-            .first()
+            .limit(1)
+            .scalar_subquery()
         )
 
-        # Get field count for latest version
-        field_count = 0
-        pii_field_count = 0
-        if latest_version:
-            field_count = (
-                self.db.query(Field)
-                .filter(Field.version_id == str(latest_version.id))
-                .count()
-            )
-            pii_field_count = (
-                self.db.query(Field)
-                .filter(Field.version_id == str(latest_version.id), Field.is_pii)
-                .count()
+        (
+            version_count,
+            latest_version_number,
+            field_count,
+            pii_field_count,
+        ) = self.db.execute(
+            select(
+                select(func.count())
+                .select_from(Version)
+                .where(Version.dictionary_id == dict_str)
+                .scalar_subquery(),
+                select(Version.version_number)
+                .where(Version.dictionary_id == dict_str)
+                .order_by(Version.version_number.desc())
+                .limit(1)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(Field)
+                .where(Field.version_id == latest_version_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(Field)
+                .where(Field.version_id == latest_version_id, Field.is_pii)
+                .scalar_subquery(),
             )
+        ).one()
 
         return {
-            "dictionary_id": str(dictionary_id),
+            "dictionary_id": dict_str,
             "name": dictionary.name,
             "total_versions": version_count,
-            "latest_version_number": latest_version.version_number if latest_version else 0,
+            "latest_version_number": latest_version_number or 0,
             "total_fields": field_count,
             "pii_fields": pii_field_count,
             "total_records_analyzed": dictionary.total_records_analyzed,
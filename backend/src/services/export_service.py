@@ -6,12 +6,17 @@ to various formats (Excel, CSV, JSON, etc.).
 """
 
 import logging
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from src.core.exceptions import (
     ExportError,
@@ -27,6 +32,54 @@ from src.models.version import Version
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Field columns the Excel exporter actually reads; used with load_only()
+# to skip hydrating the wide statistics columns
+_EXCEL_FIELD_COLUMNS = (
+    Field.field_path,
+    Field.data_type,
+    Field.semantic_type,
+    Field.sample_values,
+    Field.null_percentage,
+    Field.distinct_count,
+    Field.is_pii,
+)
+
+
+# Styles for the comparison sheets, built once at import time; openpyxl
+# style objects are immutable and safe to share across cells
+_TITLE_FONT = Font(size=14, bold=True, color="366092")
+_BOLD_FONT = Font(bold=True)
+_BREAKING_FONT = Font(color="CC0000", bold=True)
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_HEADER_FONT = Font(color="FFFFFF", bold=True)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_ADDED_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+_REMOVED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+_MODIFIED_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+
+# Column widths for the comparison sheets, applied in one pass
+_COL_WIDTHS_SUMMARY = {"A": 25, "B": 30}
+_COL_WIDTHS_DETAIL = {"A": 15, "B": 40, "C": 12, "D": 15, "E": 15, "F": 50}
+
+# Row fill per change type for the changes-detail sheet
+_FILL_BY_TYPE = {
+    "added": _ADDED_FILL,
+    "removed": _REMOVED_FILL,
+    "modified": _MODIFIED_FILL,
+}
+
+
+def _opt_float(value) -> float | None:
+    """Coerce an optional numeric column to float, keeping None (and 0.0) intact."""
+    return None if value is None else float(value)
+
+
+def _mktemp_xlsx() -> Path:
+    """Create an empty temp .xlsx file and return its path."""
+    fd, name = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    return Path(name)
+
 
 class ExportService:
     """
@@ -46,8 +99,18 @@ class ExportService:
         self.db = db
         self.excel_exporter = ExcelExporter()
 
+        # Per-instance lookup caches: export/audit paths resolve the same
+        # names and version numbers repeatedly within a request
+        self._dict_name_cache: dict[str, str] = {}
+        self._version_num_cache: dict[tuple[str, str | None], int] = {}
+
         logger.info("ExportService initialized")
 
+    def invalidate(self) -> None:
+        """Clear the name and version-number lookup caches."""
+        self._dict_name_cache.clear()
+        self._version_num_cache.clear()
+
     def get_dictionary_name(self, dictionary_id: UUID) -> str:
         """
         Get dictionary name by ID.
@@ -61,16 +124,23 @@ class ExportService:
         Raises:
             NotFoundError: If dictionary not found
         """
-        dictionary = (
-            self.db.query(Dictionary)
-            .filter(Dictionary.id == str(dictionary_id))
+        cache_key = str(dictionary_id)
+        cached = self._dict_name_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Select just the name column instead of hydrating the whole row
+        row = (
+            self.db.query(Dictionary.name)
+            .filter(Dictionary.id == cache_key)
             .first()
         )
 
-        if not dictionary:
+        if not row:
             raise NotFoundError(f"Dictionary not found: {dictionary_id}")
 
-        return dictionary.name
+        self._dict_name_cache[cache_key] = row[0]
+        return row[0]
 
     def get_version_number(
         self, dictionary_id: UUID, version_id: UUID | None = None
@@ -88,25 +158,33 @@ class ExportService:
         Raises:
             NotFoundError: If version not found
         """
-        if version_id:
-            version = (
-                self.db.query(Version)
-                .filter(Version.id == str(version_id), Version.dictionary_id == str(dictionary_id))
+        did = str(dictionary_id)
+        vid = str(version_id) if version_id else None
+        cache_key = (did, vid)
+        cached = self._version_num_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if vid:
+            row = (
+                self.db.query(Version.version_number)
+                .filter(Version.id == vid, Version.dictionary_id == did)
                 .first()
             )
         else:
             # Get latest version
-            version = (
-                self.db.query(Version)
-                .filter(Version.dictionary_id == str(dictionary_id))
+            row = (
+                self.db.query(Version.version_number)
+                .filter(Version.dictionary_id == did)
                 .order_by(Version.version_number.desc())
                 .first()
             )
 
-        if not version:
+        if not row:
             raise NotFoundError("Version not found")
 
-        return version.version_number
+        self._version_num_cache[cache_key] = row[0]
+        return row[0]
 
     def export_to_json(
         self,
@@ -132,44 +210,61 @@ class ExportService:
         Raises:
             NotFoundError: If dictionary or version not found
         """
-        # Get dictionary
-        dictionary = (
-            self.db.query(Dictionary)
-            .filter(Dictionary.id == str(dictionary_id))
+        did = str(dictionary_id)
+
+        # One outer-joined query covers the found case and both
+        # not-found cases
+        on_clause = Version.dictionary_id == Dictionary.id
+        if version_id:
+            on_clause = on_clause & (Version.id == str(version_id))
+
+        row = (
+            self.db.query(Dictionary, Version)
+            .outerjoin(Version, on_clause)
+            .filter(Dictionary.id == did)
+            .order_by(Version.version_number.desc())
+            .limit(1)
             .first()
         )
 
-        if not dictionary:
-            raise NotFoundError(f"Dictionary not found: {dictionary_id}")
-
-        # Get version
-        if version_id:
-            version = (
-                self.db.query(Version)
-                .filter(Version.id == str(version_id), Version.dictionary_id == str(dictionary_id))
-                .first()
-            )
-        else:
-            version = (
-                self.db.query(Version)
-                .filter(Version.dictionary_id == str(dictionary_id))
-                .order_by(Version.version_number.desc())
-                .first()
-            )
+        if row is None:
+            raise NotFoundError(f"Dictionary not found: {did}")
 
-        if not version:
-            raise NotFoundError(f"No versions found for dictionary {dictionary_id}")
+        dictionary, version = row
+        if version is None:
+            raise NotFoundError(f"No versions found for dictionary {did}")
 
-        # Get fields
+        # Get fields with annotations eager-loaded (avoids a lazy SELECT
+        # per field below); load only the columns the JSON payload reads
         fields = (
             self.db.query(Field)
+            .options(
+                load_only(
+                    Field.field_path,
+                    Field.field_name,
+                    Field.data_type,
+                    Field.semantic_type,
+                    Field.is_nullable,
+                    Field.is_array,
+                    Field.null_count,
+                    Field.null_percentage,
+                    Field.total_count,
+                    Field.distinct_count,
+                    Field.min_value,
+                    Field.max_value,
+                    Field.mean_value,
+                    Field.is_pii,
+                    Field.pii_type,
+                ),
+                selectinload(Field.annotations),
+            )
             .filter(Field.version_id == version.id)
             .order_by(Field.position)
             .all()
         )
 
         # Build JSON response
-        result = {
+        return {
             "dictionary": {
                 "id": str(dictionary.id),
                 "name": dictionary.name,
@@ -183,47 +278,69 @@ class ExportService:
                 "created_at": version.created_at.isoformat(),
                 "created_by": version.created_by,
             },
-            "fields": [],
+            "fields": [
+                self._field_to_dict(
+                    field, include_statistics, include_annotations, include_pii_info
+                )
+                for field in fields
+            ],
+        }
+
+    @staticmethod
+    def _field_to_dict(
+        field: Field,
+        include_statistics: bool,
+        include_annotations: bool,
+        include_pii_info: bool,
+    ) -> dict[str, Any]:
+        """
+        Build the JSON payload for a single field.
+
+        Args:
+            field: Field ORM instance with annotations loaded
+            include_statistics: Include statistical data
+            include_annotations: Include the latest annotation
+            include_pii_info: Include PII information
+
+        Returns:
+            dict: JSON-safe field payload
+        """
+        field_data = {
+            "field_path": field.field_path,
+            "field_name": field.field_name,
+            "data_type": field.data_type,
+            "semantic_type": field.semantic_type,
+            "is_nullable": field.is_nullable,
+            "is_array": field.is_array,
         }
 
-        # Add fields
-        for field in fields:
-            field_data = {
-                "field_path": field.field_path,
-                "field_name": field.field_name,
-                "data_type": field.data_type,
-                "semantic_type": field.semantic_type,
-                "is_nullable": field.is_nullable,
-                "is_array": field.is_array,
+        if include_statistics:
+            field_data["statistics"] = {
+                "null_count": field.null_count,
+                "null_percentage": _opt_float(field.null_percentage),
+                "total_count": field.total_count,
+                "distinct_count": field.distinct_count,
+                "min_value": _opt_float(field.min_value),
+                "max_value": _opt_float(field.max_value),
+                "mean_value": _opt_float(field.mean_value),
             }
 
-            if include_statistics:
-                field_data["statistics"] = {
-                    "null_count": field.null_count,
-                    "null_percentage": float(field.null_percentage) if field.null_percentage else None,
-                    "total_count": field.total_count,
-                    "distinct_count": field.distinct_count,
-                    "min_value": float(field.min_value) if field.min_value else None,
-                    "max_value": float(field.max_value) if field.max_value else None,
-                    "mean_value": float(field.mean_value) if field.mean_value else None,
-                }
-
-            if include_pii_info:
-                field_data["pii"] = {
-                    "is_pii": field.is_pii,
-                    "pii_type": field.pii_type,
-                }
-
-            if include_annotations and field.annotation:
-                field_data["annotation"] = {
-                    "description": field.annotation.description,
-                    "business_name": field.annotation.business_name,
-                    "is_ai_generated": field.annotation.is_ai_generated,
-                }
-
-            result["fields"].append(field_data)
-
-        return result
+        if include_pii_info:
+            field_data["pii"] = {
+                "is_pii": field.is_pii,
+                "pii_type": field.pii_type,
+            }
+
+        if include_annotations and field.annotations:
+            # annotations are ordered newest first
+            annotation = field.annotations[0]
+            field_data["annotation"] = {
+                "description": annotation.description,
+                "business_name": annotation.business_name,
+                "is_ai_generated": annotation.is_ai_generated,
+            }
+
+        return field_data
 
     def export_to_excel(
         self,
@@ -255,22 +372,22 @@ class ExportService:
             ValidationError: If output path is invalid
             ExportError: If export fails
         """
+        did = str(dictionary_id)
+        vid = str(version_id) if version_id else None
+
         logger.info(
-            f"Exporting dictionary {dictionary_id} to Excel",
+            "Exporting dictionary %s to Excel",
+            did,
             extra={
-                "dictionary_id": str(dictionary_id),
+                "dictionary_id": did,
                 "output_path": str(output_path) if output_path else "temp",
-                "version_id": str(version_id) if version_id else "latest",
+                "version_id": vid or "latest",
             },
         )
 
         # Create temp file if no output path provided
         if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=".xlsx", mode="wb"
-            )
-            output_path = Path(temp_file.name)
-            temp_file.close()
+            output_path = _mktemp_xlsx()
         else:
             # Validate output path
             if output_path.suffix.lower() not in [".xlsx", ".xls"]:
@@ -279,57 +396,55 @@ class ExportService:
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Get dictionary
-        dictionary = (
-            self.db.query(Dictionary)
-            .filter(Dictionary.id == str(dictionary_id))
+        # One outer-joined query covers the found case and all three
+        # not-found cases
+        on_clause = Version.dictionary_id == Dictionary.id
+        if vid:
+            on_clause = on_clause & (Version.id == vid)
+
+        row = (
+            self.db.query(Dictionary, Version)
+            .outerjoin(Version, on_clause)
+            .filter(Dictionary.id == did)
+            .order_by(Version.version_number.desc())
+            .limit(1)
             .first()
         )
 
-        if not dictionary:
+        if row is None:
             raise NotFoundError(
-                f"Dictionary not found: {dictionary_id}",
-                details={"dictionary_id": str(dictionary_id)},
+                f"Dictionary not found: {did}",
+                details={"dictionary_id": did},
             )
 
-        # Get version
-        if version_id:
-            version = (
-                self.db.query(Version)
-                .filter(Version.id == str(version_id), Version.dictionary_id == str(dictionary_id))
-                .first()
-            )
-            if not version:
+        dictionary, version = row
+        if version is None:
+            if vid:
                 raise NotFoundError(
-                    f"Version not found: {version_id}",
-                    details={"version_id": str(version_id)},
+                    f"Version not found: {vid}",
+                    details={"version_id": vid},
                 )
-        else:
-            # Get latest version
-            version = (
-                self.db.query(Version)
-                .filter(Version.dictionary_id == str(dictionary_id))
-                .order_by(Version.version_number.desc())
-                .first()
+            raise NotFoundError(
+                f"No versions found for dictionary {did}",
+                details={"dictionary_id": did},
             )
-            if not version:
-                raise NotFoundError(
-                    f"No versions found for dictionary {dictionary_id}",
-                    details={"dictionary_id": str(dictionary_id)},
-                )
 
-        # Get fields for version
+        # Get fields for version with annotations eager-loaded for the
+        # exporter's description lookups
+        version_id_str = str(version.id)
         fields = (
             self.db.query(Field)
-            .filter(Field.version_id == str(version.id))
+            .options(load_only(*_EXCEL_FIELD_COLUMNS), selectinload(Field.annotations))
+            .filter(Field.version_id == version_id_str)
             .order_by(Field.position)
             .all()
         )
 
         if not fields:
             logger.warning(
-                f"No fields found for version {version.id}",
-                extra={"version_id": str(version.id)},
+                "No fields found for version %s",
+                version_id_str,
+                extra={"version_id": version_id_str},
             )
 
         # Perform export
@@ -341,20 +456,21 @@ class ExportService:
             )
 
             logger.info(
-                f"Excel export completed successfully: {output_path}",
+                "Excel export completed successfully: %s",
+                output_path,
                 extra={
-                    "dictionary_id": str(dictionary_id),
-                    "version_id": str(version.id),
+                    "dictionary_id": did,
+                    "version_id": version_id_str,
                     "num_fields": len(fields),
                 },
             )
 
         except Exception as e:
-            logger.error(f"Excel export failed: {e}", exc_info=True)
+            logger.error("Excel export failed: %s", e, exc_info=True)
             raise ExportError(
                 f"Failed to export dictionary to Excel: {str(e)}",
                 details={
-                    "dictionary_id": str(dictionary_id),
+                    "dictionary_id": did,
                     "output_path": str(output_path),
                 },
             )
@@ -364,8 +480,8 @@ class ExportService:
             "Dictionary exported to Excel",
             extra={
                 "action": "export_to_excel",
-                "dictionary_id": str(dictionary_id),
-                "version_id": str(version.id),
+                "dictionary_id": did,
+                "version_id": version_id_str,
                 "version_number": version.version_number,
                 "output_path": str(output_path),
                 "exported_by": exported_by,
@@ -405,13 +521,11 @@ class ExportService:
         """
         from services.version_service import VersionService
 
+        did = str(dictionary_id)
+
         # Create temp file if no output path provided
         if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=".xlsx", mode="wb"
-            )
-            output_path = Path(temp_file.name)
-            temp_file.close()
+            output_path = _mktemp_xlsx()
 
         # Get comparison data from version service
         version_service = VersionService(db=self.db)
@@ -421,9 +535,10 @@ class ExportService:
             version_2_number=version_2_number,
         )
         logger.info(
-            f"Exporting version comparison for dictionary {dictionary_id}",
+            "Exporting version comparison for dictionary %s",
+            did,
             extra={
-                "dictionary_id": str(dictionary_id),
+                "dictionary_id": did,
                 "v1": version_1_number,
                 "v2": version_2_number,
             },
@@ -437,37 +552,37 @@ class ExportService:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            from openpyxl import Workbook
-
-            wb = Workbook()
-            wb.remove(wb.active)
+            # Write-only mode streams rows to disk instead of holding the
+            # whole workbook in memory
+            wb = Workbook(write_only=True)
 
             # Create summary sheet
-            summary_sheet = wb.create_sheet("Comparison Summary", 0)
+            summary_sheet = wb.create_sheet("Comparison Summary")
             self._write_comparison_summary(summary_sheet, comparison_data)
 
             # Create changes sheet
-            changes_sheet = wb.create_sheet("Changes Detail", 1)
+            changes_sheet = wb.create_sheet("Changes Detail")
             self._write_changes_detail(changes_sheet, comparison_data)
 
             # Save workbook
             wb.save(output_path)
 
             logger.info(
-                f"Version comparison export completed: {output_path}",
+                "Version comparison export completed: %s",
+                output_path,
                 extra={
-                    "dictionary_id": str(dictionary_id),
+                    "dictionary_id": did,
                     "v1": version_1_number,
                     "v2": version_2_number,
                 },
             )
 
         except Exception as e:
-            logger.error(f"Version comparison export failed: {e}", exc_info=True)
+            logger.error("Version comparison export failed: %s", e, exc_info=True)
             raise ExportError(
                 f"Failed to export version comparison: {str(e)}",
                 details={
-                    "dictionary_id": str(dictionary_id),
+                    "dictionary_id": did,
                     "v1": version_1_number,
                     "v2": version_2_number,
                 },
@@ -478,7 +593,7 @@ class ExportService:
             "Version comparison exported",
             extra={
                 "action": "export_version_comparison",
-                "dictionary_id": str(dictionary_id),
+                "dictionary_id": did,
                 "v1": version_1_number,
                 "v2": version_2_number,
                 "output_path": str(output_path),
@@ -490,39 +605,39 @@ class ExportService:
 
     def _write_comparison_summary(self, ws, comparison_data: dict) -> None:
         """
-        Write comparison summary sheet.
+        Write comparison summary sheet (write-only worksheet).
 
         Args:
-            ws: Worksheet to write to
+            ws: Write-only worksheet to write to
             comparison_data: Comparison results
         """
-        from openpyxl.styles import Font
+        def styled(value, font):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = font
+            return cell
 
-        # Title
-        ws.cell(row=1, column=1, value="Version Comparison Summary")
-        ws.cell(row=1, column=1).font = Font(size=14, bold=True, color="366092")
+        # Column widths must be set before rows are appended in
+        # write-only mode
+        for letter, width in _COL_WIDTHS_SUMMARY.items():
+            ws.column_dimensions[letter].width = width
 
         # Version info
         v1_info = comparison_data.get("version_1", {})
         v2_info = comparison_data.get("version_2", {})
 
-        ws.cell(row=3, column=1, value="Version 1")
-        ws.cell(row=3, column=1).font = Font(bold=True)
-        ws.cell(row=3, column=2, value=f"v{v1_info.get('version_number', 'N/A')}")
-        ws.cell(row=4, column=1, value="Created")
-        ws.cell(row=4, column=2, value=v1_info.get("created_at", "N/A"))
-
-        ws.cell(row=6, column=1, value="Version 2")
-        ws.cell(row=6, column=1).font = Font(bold=True)
-        ws.cell(row=6, column=2, value=f"v{v2_info.get('version_number', 'N/A')}")
-        ws.cell(row=7, column=1, value="Created")
-        ws.cell(row=7, column=2, value=v2_info.get("created_at", "N/A"))
+        ws.append([styled("Version Comparison Summary", _TITLE_FONT)])
+        ws.append([])
+        ws.append([styled("Version 1", _BOLD_FONT), f"v{v1_info.get('version_number', 'N/A')}"])
+        ws.append(["Created", v1_info.get("created_at", "N/A")])
+        ws.append([])
+        ws.append([styled("Version 2", _BOLD_FONT), f"v{v2_info.get('version_number', 'N/A')}"])
+        ws.append(["Created", v2_info.get("created_at", "N/A")])
+        ws.append([])
 
         # Summary statistics
         summary = comparison_data.get("summary", {})
 
-        ws.cell(row=9, column=1, value="Change Summary")
-        ws.cell(row=9, column=1).font = Font(bold=True)
+        ws.append([styled("Change Summary", _BOLD_FONT)])
 
         stats = [
             ("Fields Added", summary.get("fields_added", 0)),
@@ -533,36 +648,34 @@ class ExportService:
             ("Total Fields (v2)", summary.get("total_fields_v2", 0)),
         ]
 
-        for i, (label, value) in enumerate(stats, start=10):
-            ws.cell(row=i, column=1, value=label)
-            ws.cell(row=i, column=1).font = Font(bold=True)
-            ws.cell(row=i, column=2, value=value)
-
+        for label, value in stats:
             # Highlight breaking changes
             if label == "Breaking Changes" and value > 0:
-                ws.cell(row=i, column=2).font = Font(color="CC0000", bold=True)
-
-        # Set column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 30
+                ws.append([styled(label, _BOLD_FONT), styled(value, _BREAKING_FONT)])
+            else:
+                ws.append([styled(label, _BOLD_FONT), value])
 
     def _write_changes_detail(self, ws, comparison_data: dict) -> None:
         """
-        Write changes detail sheet.
+        Write changes detail sheet (write-only worksheet).
 
         Args:
-            ws: Worksheet to write to
+            ws: Write-only worksheet to write to
             comparison_data: Comparison results
         """
-        from openpyxl.styles import Alignment, Font, PatternFill
+        changes = comparison_data.get("changes", [])
 
-        # Header colors
-        HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        HEADER_FONT = Font(color="FFFFFF", bold=True)
-        ADDED_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        REMOVED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        MODIFIED_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-        BREAKING_FONT = Font(color="CC0000", bold=True)
+        # Layout must be configured before rows are appended in
+        # write-only mode
+        for letter, width in _COL_WIDTHS_DETAIL.items():
+            ws.column_dimensions[letter].width = width
+
+        # Freeze header row
+        ws.freeze_panes = "A2"
+
+        # Add auto-filter
+        if changes:
+            ws.auto_filter.ref = f"A1:F{len(changes) + 1}"
 
         # Headers
         headers = [
@@ -574,16 +687,16 @@ class ExportService:
             "Changes",
         ]
 
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _HEADER_ALIGNMENT
+            header_row.append(cell)
+        ws.append(header_row)
 
         # Write changes
-        changes = comparison_data.get("changes", [])
-        row_idx = 2
-
         for change in changes:
             change_type = change.get("change_type", "")
             field_path = change.get("field_path", "")
@@ -596,47 +709,28 @@ class ExportService:
             new_type = v2_data.get("data_type", "N/A")
             changes_list = change.get("changes", [])
 
-            # Write row
-            ws.cell(row=row_idx, column=1, value=change_type.upper())
-            ws.cell(row=row_idx, column=2, value=field_path)
-            ws.cell(row=row_idx, column=3, value="Yes" if is_breaking else "No")
-            ws.cell(row=row_idx, column=4, value=old_type)
-            ws.cell(row=row_idx, column=5, value=new_type)
-            ws.cell(row=row_idx, column=6, value="; ".join(changes_list))
-
             # Color based on change type
-            fill = None
-            if change_type == "added":
-                fill = ADDED_FILL
-            elif change_type == "removed":
-                fill = REMOVED_FILL
-            elif change_type == "modified":
-                fill = MODIFIED_FILL
-
-            if fill:
-                for col_idx in range(1, 7):
-                    ws.cell(row=row_idx, column=col_idx).fill = fill
-
-            # Highlight breaking changes
-            if is_breaking:
-                ws.cell(row=row_idx, column=3).font = BREAKING_FONT
-
-            row_idx += 1
-
-        # Set column widths
-        ws.column_dimensions["A"].width = 15
-        ws.column_dimensions["B"].width = 40
-        ws.column_dimensions["C"].width = 12
-        ws.column_dimensions["D"].width = 15
-        ws.column_dimensions["E"].width = 15
-        ws.column_dimensions["F"].width = 50
-
-        # Freeze header row
-        ws.freeze_panes = "A2"
-
-        # Add auto-filter
-        if changes:
-            ws.auto_filter.ref = f"A1:F{row_idx - 1}"
+            fill = _FILL_BY_TYPE.get(change_type)
+
+            values = [
+                change_type.upper(),
+                field_path,
+                "Yes" if is_breaking else "No",
+                old_type,
+                new_type,
+                "; ".join(changes_list),
+            ]
+
+            row = []
+            for col_idx, value in enumerate(values, start=1):
+                cell = WriteOnlyCell(ws, value=value)
+                if fill:
+                    cell.fill = fill
+                # Highlight breaking changes
+                if is_breaking and col_idx == 3:
+                    cell.font = _BREAKING_FONT
+                row.append(cell)
+            ws.append(row)
 
     def batch_export_to_excel(
         self,
@@ -670,7 +764,8 @@ class ExportService:
             ExportError: If export fails
         """
         logger.info(
-            f"Batch exporting {len(dictionary_ids)} dictionaries to Excel",
+            "Batch exporting %d dictionaries to Excel",
+            len(dictionary_ids),
             extra={
                 "num_dictionaries": len(dictionary_ids),
                 "output_path": str(output_path) if output_path else "temp",
@@ -683,11 +778,7 @@ class ExportService:
 
         # Create temp file if no output path provided
         if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=".xlsx", mode="wb"
-            )
-            output_path = Path(temp_file.name)
-            temp_file.close()
+            output_path = _mktemp_xlsx()
         else:
             # Validate output path
             if output_path.suffix.lower() not in [".xlsx", ".xls"]:
@@ -696,48 +787,80 @@ class ExportService:
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Collect data for all dictionaries
-        dictionaries_data = []
-        for dictionary_id in dictionary_ids:
-            # Get dictionary
-            dictionary = (
-                self.db.query(Dictionary)
-                .filter(Dictionary.id == str(dictionary_id))
-                .first()
-            )
+        # Collect data for all dictionaries in three bulk queries instead
+        # of three queries per dictionary
+        str_ids = [str(d_id) for d_id in dictionary_ids]
+
+        dictionaries_by_id = {
+            dictionary.id: dictionary
+            for dictionary in self.db.query(Dictionary)
+            .filter(Dictionary.id.in_(str_ids))
+            .all()
+        }
 
-            if not dictionary:
+        for dictionary_id in str_ids:
+            if dictionary_id not in dictionaries_by_id:
                 raise NotFoundError(
                     f"Dictionary not found: {dictionary_id}",
-                    details={"dictionary_id": str(dictionary_id)},
+                    details={"dictionary_id": dictionary_id},
                 )
 
-            # Get latest version
-            version = (
-                self.db.query(Version)
-                .filter(Version.dictionary_id == str(dictionary_id))
-                .order_by(Version.version_number.desc())
-                .first()
+        # Latest version per dictionary via a group-by subquery join
+        latest = (
+            self.db.query(
+                Version.dictionary_id,
+                func.max(Version.version_number).label("version_number"),
+            )
+            .filter(Version.dictionary_id.in_(str_ids))
+            .group_by(Version.dictionary_id)
+            .subquery()
+        )
+        versions_by_dict_id = {
+            version.dictionary_id: version
+            for version in self.db.query(Version)
+            .join(
+                latest,
+                (Version.dictionary_id == latest.c.dictionary_id)
+                & (Version.version_number == latest.c.version_number),
             )
+            .all()
+        }
 
-            if not version:
+        for dictionary_id in str_ids:
+            if dictionary_id not in versions_by_dict_id:
                 raise NotFoundError(
                     f"No versions found for dictionary {dictionary_id}",
-                    details={"dictionary_id": str(dictionary_id)},
+                    details={"dictionary_id": dictionary_id},
                 )
 
-            # Get fields for version
-            fields = (
-                self.db.query(Field)
-                .filter(Field.version_id == str(version.id))
-                .order_by(Field.position)
-                .all()
+        # All fields for the selected versions, bucketed by version id
+        fields_by_version_id: dict[str, list[Field]] = {
+            version.id: [] for version in versions_by_dict_id.values()
+        }
+        # Stream the rows in chunks instead of materializing the full
+        # result set in the driver before hydration
+        field_rows = (
+            self.db.query(Field)
+            # version_id is needed for the bucketing below
+            .options(
+                load_only(Field.version_id, *_EXCEL_FIELD_COLUMNS),
+                selectinload(Field.annotations),
             )
+            .filter(Field.version_id.in_(list(fields_by_version_id)))
+            .order_by(Field.version_id, Field.position)
+            .execution_options(stream_results=True)
+            .yield_per(1000)
+        )
+        for field in field_rows:
+            fields_by_version_id[field.version_id].append(field)
 
+        dictionaries_data = []
+        for dictionary_id in str_ids:
+            version = versions_by_dict_id[dictionary_id]
             dictionaries_data.append({
-                "dictionary": dictionary,
+                "dictionary": dictionaries_by_id[dictionary_id],
                 "version": version,
-                "fields": fields,
+                "fields": fields_by_version_id[version.id],
             })
 
         # Perform batch export
@@ -748,7 +871,8 @@ class ExportService:
             )
 
             logger.info(
-                f"Batch Excel export completed successfully: {output_path}",
+                "Batch Excel export completed successfully: %s",
+                output_path,
                 extra={
                     "num_dictionaries": len(dictionary_ids),
                     "output_path": str(output_path),
@@ -756,7 +880,7 @@ class ExportService:
             )
 
         except Exception as e:
-            logger.error(f"Batch Excel export failed: {e}", exc_info=True)
+            logger.error("Batch Excel export failed: %s", e, exc_info=True)
             raise ExportError(
                 f"Failed to batch export dictionaries to Excel: {str(e)}",
                 details={
@@ -770,7 +894,7 @@ class ExportService:
             "Dictionaries batch exported to Excel",
             extra={
                 "action": "batch_export_to_excel",
-                "dictionary_ids": [str(d_id) for d_id in dictionary_ids],
+                "dictionary_ids": str_ids,
                 "num_dictionaries": len(dictionary_ids),
                 "output_path": str(output_path),
                 "exported_by": exported_by,
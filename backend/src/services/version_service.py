@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import Row, func, insert
 from sqlalchemy.orm import Session
 
 from src.core.exceptions import (
@@ -31,6 +32,23 @@ from src.processors.type_inferrer import TypeInferrer
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Columns the version diff actually touches; loading only these skips
+# hydrating full Field rows (including the large sample_values JSON)
+_COMPARE_FIELD_COLUMNS = (
+    Field.version_id,
+    Field.field_path,
+    Field.field_name,
+    Field.data_type,
+    Field.semantic_type,
+    Field.is_nullable,
+    Field.is_array,
+    Field.array_item_type,
+    Field.is_pii,
+    Field.pii_type,
+    Field.null_percentage,
+    Field.confidence_score,
+)
+
 
 class VersionService:
     """
@@ -149,21 +167,27 @@ class VersionService:
             logger.error(f"Failed to create version record: {e}")
             raise DatabaseError(f"Failed to create version: {str(e)}")
 
-        # Process fields
+        # Process fields into plain row mappings, then bulk insert them in
+        # one multi-row statement instead of an add/flush round trip per
+        # field. Bad fields are logged and skipped before the bulk call
         logger.info(f"Processing {len(parse_result['fields'])} fields")
-        fields_created = 0
 
+        field_rows = []
         for position, field_meta in enumerate(parse_result["fields"]):
             try:
-                self._process_field(version, field_meta, position)
-                fields_created += 1
+                field_rows.append(
+                    self._build_field_mapping(version.id, field_meta, position)
+                )
             except Exception as e:
                 logger.error(
                     f"Failed to process field {field_meta['field_path']}: {e}"
                 )
+        fields_created = len(field_rows)
 
         # Commit transaction
         try:
+            if field_rows:
+                self.db.execute(insert(Field), field_rows)
             self.db.commit()
             logger.info(
                 f"Version created successfully: {version.id}",
@@ -192,22 +216,22 @@ class VersionService:
 
         return version
 
-    def _process_field(
+    def _build_field_mapping(
         self,
-        version: Version,
+        version_id: str,
         field_meta: dict[str, Any],
         position: int,
-    ) -> Field:
+    ) -> dict[str, Any]:
         """
-        Process a single field.
+        Build a field row mapping for bulk insert.
 
         Args:
-            version: Version to attach field to
+            version_id: Version the field belongs to
             field_meta: Field metadata from parser
             position: Position in field list
 
         Returns:
-            Field: Created field record
+            dict: Column values for one Field row
         """
         # Infer type
         data_type, confidence = self.type_inferrer.infer_type(
@@ -247,42 +271,37 @@ class VersionService:
                 list(field_meta["array_item_types"])
             )
 
-        # Create field record
-        field = Field(
-            version_id=version.id,
-            field_path=field_meta["field_path"],
-            field_name=field_meta["field_name"],
-            parent_path=field_meta["parent_path"] or None,
-            nesting_level=field_meta["nesting_level"],
-            data_type=data_type,
-            semantic_type=semantic_type,
-            is_nullable=is_nullable,
-            is_array=is_array,
-            array_item_type=array_item_type,
-            sample_values={"values": field_meta["sample_values"]},
-            null_count=field_meta.get("null_count", 0),
-            null_percentage=null_percentage,
-            total_count=quality_metrics.get("total_count", field_meta.get("total_count", 0)),
-            distinct_count=quality_metrics.get("distinct_count", 0),
-            cardinality_ratio=quality_metrics.get("cardinality_ratio"),
-            min_value=quality_metrics.get("min_value"),
-            max_value=quality_metrics.get("max_value"),
-            mean_value=quality_metrics.get("mean_value"),
-            median_value=quality_metrics.get("median_value"),
-            std_dev=quality_metrics.get("std_dev"),
-            percentile_25=quality_metrics.get("percentile_25"),
-            percentile_50=quality_metrics.get("percentile_50"),
-            percentile_75=quality_metrics.get("percentile_75"),
-            is_pii=is_pii,
-            pii_type=pii_type,
-            confidence_score=confidence,
-            position=position,
-        )
-
-        self.db.add(field)
-        self.db.flush()
-
-        return field
+        # Build field row; id and created_at come from the column defaults
+        return {
+            "version_id": version_id,
+            "field_path": field_meta["field_path"],
+            "field_name": field_meta["field_name"],
+            "parent_path": field_meta["parent_path"] or None,
+            "nesting_level": field_meta["nesting_level"],
+            "data_type": data_type,
+            "semantic_type": semantic_type,
+            "is_nullable": is_nullable,
+            "is_array": is_array,
+            "array_item_type": array_item_type,
+            "sample_values": {"values": field_meta["sample_values"]},
+            "null_count": field_meta.get("null_count", 0),
+            "null_percentage": null_percentage,
+            "total_count": quality_metrics.get("total_count", field_meta.get("total_count", 0)),
+            "distinct_count": quality_metrics.get("distinct_count", 0),
+            "cardinality_ratio": quality_metrics.get("cardinality_ratio"),
+            "min_value": quality_metrics.get("min_value"),
+            "max_value": quality_metrics.get("max_value"),
+            "mean_value": quality_metrics.get("mean_value"),
+            "median_value": quality_metrics.get("median_value"),
+            "std_dev": quality_metrics.get("std_dev"),
+            "percentile_25": quality_metrics.get("percentile_25"),
+            "percentile_50": quality_metrics.get("percentile_50"),
+            "percentile_75": quality_metrics.get("percentile_75"),
+            "is_pii": is_pii,
+            "pii_type": pii_type,
+            "confidence_score": confidence,
+            "position": position,
+        }
 
     def _calculate_schema_hash(self, fields: list[dict[str, Any]]) -> str:
         """
@@ -366,9 +385,31 @@ class VersionService:
         if not version2:
             raise NotFoundError(f"Version {version2_number} not found")
 
-        # Get fields for both versions
-        v1_fields = self.get_version_fields(version1.id)
-        v2_fields = self.get_version_fields(version2.id)
+        # Identical schema hashes mean the structural diff is empty, so
+        # skip loading and diffing fields entirely; only the field counts
+        # are queried. The hash covers (field_path, primary type) pairs,
+        # so semantic- or PII-only drift is not detected on this path
+        if version1.schema_hash == version2.schema_hash:
+            return {
+                "summary": {
+                    "fields_added": 0,
+                    "fields_removed": 0,
+                    "fields_modified": 0,
+                    "breaking_changes": 0,
+                    "total_fields_v1": self._count_version_fields(version1.id),
+                    "total_fields_v2": self._count_version_fields(version2.id),
+                },
+                "changes": [],
+                "version_1": self._version_info(version1),
+                "version_2": self._version_info(version2),
+            }
+
+        # Get fields for both versions in one roundtrip
+        fields_by_version = self._get_fields_for_versions(
+            [version1.id, version2.id]
+        )
+        v1_fields = fields_by_version[version1.id]
+        v2_fields = fields_by_version[version2.id]
 
         # Create maps
         v1_map = {f.field_path: f for f in v1_fields}
@@ -433,21 +474,29 @@ class VersionService:
         return {
             "summary": summary,
             "changes": changes,
-            "version_1": {
-                "id": str(version1.id),
-                "version_number": version1.version_number,
-                "created_at": version1.created_at.isoformat(),
-                "schema_hash": version1.schema_hash,
-            },
-            "version_2": {
-                "id": str(version2.id),
-                "version_number": version2.version_number,
-                "created_at": version2.created_at.isoformat(),
-                "schema_hash": version2.schema_hash,
-            },
+            "version_1": self._version_info(version1),
+            "version_2": self._version_info(version2),
         }
 
-    def _is_breaking_change(self, v1_field: Field, v2_field: Field) -> bool:
+    def _count_version_fields(self, version_id: str) -> int:
+        """Count fields for a version without loading them."""
+        return (
+            self.db.query(func.count(Field.id))
+            .filter(Field.version_id == str(version_id))
+            .scalar()
+        )
+
+    @staticmethod
+    def _version_info(version: Version) -> dict[str, Any]:
+        """Build the version block of a comparison result."""
+        return {
+            "id": str(version.id),
+            "version_number": version.version_number,
+            "created_at": version.created_at.isoformat(),
+            "schema_hash": version.schema_hash,
+        }
+
+    def _is_breaking_change(self, v1_field: Field | Row, v2_field: Field | Row) -> bool:
         """
         Determine if change is breaking.
 
@@ -477,7 +526,7 @@ class VersionService:
 
         return False
 
-    def _fields_differ(self, v1_field: Field, v2_field: Field) -> bool:
+    def _fields_differ(self, v1_field: Field | Row, v2_field: Field | Row) -> bool:
         """
         Check if two fields have meaningful differences.
 
@@ -497,7 +546,7 @@ class VersionService:
             or v1_field.is_pii != v2_field.is_pii
         )
 
-    def _get_field_changes(self, v1_field: Field, v2_field: Field) -> list[str]:
+    def _get_field_changes(self, v1_field: Field | Row, v2_field: Field | Row) -> list[str]:
         """
         Get list of specific changes between fields.
 
@@ -531,12 +580,12 @@ class VersionService:
 
         return changes
 
-    def _field_to_dict(self, field: Field) -> dict[str, Any]:
+    def _field_to_dict(self, field: Field | Row) -> dict[str, Any]:
         """
         Convert field to dictionary.
 
         Args:
-            field: Field object
+            field: Field object or comparison-column row
 
         Returns:
             Dictionary representation
@@ -555,6 +604,34 @@ class VersionService:
             "confidence_score": float(field.confidence_score) if field.confidence_score else 0.0,
         }
 
+    def _get_fields_for_versions(
+        self, version_ids: list[str]
+    ) -> dict[str, list[Row]]:
+        """
+        Fetch comparison columns for several versions in one query.
+
+        Args:
+            version_ids: Version ids to load fields for
+
+        Returns:
+            Mapping of version id to its field rows (comparison columns
+            only, not full Field objects)
+        """
+        fields_by_version: dict[str, list[Row]] = {
+            str(version_id): [] for version_id in version_ids
+        }
+
+        rows = (
+            self.db.query(*_COMPARE_FIELD_COLUMNS)
+            .filter(Field.version_id.in_(list(fields_by_version)))
+            .order_by(Field.position)
+            .all()
+        )
+        for row in rows:
+            fields_by_version[row.version_id].append(row)
+
+        return fields_by_version
+
     def get_version_fields(self, version_id: UUID) -> list[Field]:
         """
         Get all fields for a version.